@@ -42,6 +42,8 @@ class Config:
 
     # Rate limiting (e.g. "100/minute" per IP)
     RATE_LIMIT = os.getenv("RATE_LIMIT", "100/minute")
+    # Counter backend; redis://... shares counts across uvicorn workers
+    RATE_LIMIT_STORAGE_URI = os.getenv("REDIS_URL", "memory://")
 
     @classmethod
     def as_dict(cls) -> Dict[str, Any]:
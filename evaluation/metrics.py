@@ -8,7 +8,9 @@ and retrieval performance.
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Dict, List
+
+import numpy as np
 
 from observability.logger import log_info, log_warning
 
@@ -31,35 +33,33 @@ def calculate_metrics(evaluation_results: List[Dict]) -> Dict[str, float]:
 
     total = len(evaluation_results)
 
-    hallucination_scores = []
-    answer_quality_scores = []
-    retrieval_ndcg_scores = []
-    validation_passed = 0
-
-    for result in evaluation_results:
-        eval_data = result.get("evaluation", {})
-
-        # Hallucination (higher is better = less hallucination)
-        hallucination_scores.append(1.0 - eval_data.get("hallucination_score", 0.5))
-
-        # Answer Quality
-        answer_quality_scores.append(
-            eval_data.get("answer_quality", {}).get("score", 0.5)
-        )
-
-        # Retrieval Quality
-        retrieval_ndcg_scores.append(
-            eval_data.get("retrieval_metrics", {}).get("ndcg", 0.5)
-        )
-
-        # Validation count
-        if eval_data.get("validation_result", False):
-            validation_passed += 1
+    evals = [result.get("evaluation", {}) for result in evaluation_results]
+
+    # (total, 3) array built in one call: hallucination, answer quality, nDCG
+    scores = np.fromiter(
+        (
+            (
+                e.get("hallucination_score", 0.5),
+                e.get("answer_quality", {}).get("score", 0.5),
+                e.get("retrieval_metrics", {}).get("ndcg", 0.5),
+            )
+            for e in evals
+        ),
+        dtype=np.dtype((np.float64, 3)),
+        count=total,
+    )
+    validation_passed = np.fromiter(
+        (bool(e.get("validation_result", False)) for e in evals),
+        dtype=bool,
+        count=total,
+    )
 
-    # Compute averages
-    avg_hallucination = sum(hallucination_scores) / total
-    avg_answer_quality = sum(answer_quality_scores) / total
-    avg_retrieval = sum(retrieval_ndcg_scores) / total
+    # Column means in one vectorized pass
+    avg_hallucination_rate, avg_answer_quality, avg_retrieval = (
+        float(v) for v in scores.mean(axis=0)
+    )
+    # Hallucination (higher is better = less hallucination)
+    avg_hallucination = 1.0 - avg_hallucination_rate
 
     # Weighted overall score
     overall_score = round(
@@ -68,10 +68,10 @@ def calculate_metrics(evaluation_results: List[Dict]) -> Dict[str, float]:
 
     metrics = {
         "overall_score": overall_score,
-        "avg_hallucination_rate": round(1.0 - avg_hallucination, 4),
+        "avg_hallucination_rate": round(avg_hallucination_rate, 4),
         "avg_answer_quality": round(avg_answer_quality, 4),
         "avg_retrieval_ndcg": round(avg_retrieval, 4),
-        "validation_pass_rate": round(validation_passed / total, 4),
+        "validation_pass_rate": round(float(validation_passed.mean()), 4),
         "total_evaluated": total,
     }
 
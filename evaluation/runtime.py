@@ -0,0 +1,27 @@
+# evaluation/runtime.py
+"""
+Evaluator Singleton
+
+Process-wide AgentEvaluator shared by evaluation entry points
+(evaluate_single, run_benchmark), so the benchmark file load and judge
+setup happen once per process.
+"""
+
+from functools import lru_cache
+
+from evaluation.evaluator import AgentEvaluator
+from observability.logger import log_warning
+
+
+@lru_cache(maxsize=1)
+def get_evaluator() -> AgentEvaluator:
+    """Return the shared AgentEvaluator (built on first use)."""
+    return AgentEvaluator()
+
+
+async def warmup_evaluator() -> None:
+    """Run one throwaway evaluation so judge-model setup is not timed."""
+    try:
+        await get_evaluator().evaluate_single_query("warmup", "x", [], None)
+    except Exception as e:
+        log_warning(f"⚠️ [Evaluation] Evaluator warmup failed: {e}")
@@ -7,6 +7,7 @@ It connects all nodes and defines the execution flow with conditional routing
 and a controlled critic-based validation loop.
 """
 
+import json
 import os
 
 from langgraph.graph import END, START, StateGraph
@@ -16,9 +17,12 @@ from graph.constants import (
     SAFE_CLARIFICATION_MSG,
     SAFE_MEETING_MSG,
 )
-from graph.state import AgentState
+from graph.diagnostics import timed_node
+from graph.node_cache import NodeCache
+from graph.state import AgentState, ToolOutput
 from observability.logger import log_error, log_info, log_warning
-from tools.registry import ToolRegistry
+from retrieval.vector_store import prefetch_vector_store
+from tools.registry import invoke as invoke_tool
 
 # Import production nodes
 from .nodes.calculation import perform_calculation
@@ -33,6 +37,12 @@ from .nodes.structured import structured_extraction
 from .nodes.validation import validate_response
 
 
+async def extract_filters_entry(state: AgentState) -> dict:
+    """Graph entry: start opening the vector store while filters are extracted."""
+    prefetch_vector_store()
+    return await extract_filters(state)
+
+
 def finalize_response(state: AgentState) -> AgentState:
     """
     Ensures we always return a safe final_output at END.
@@ -75,8 +85,8 @@ async def call_tools(state: AgentState) -> AgentState:
                 tool_name = tool_part.split()[0]
 
                 log_info(f"Executing tool: {tool_name}")
-                output = await ToolRegistry.invoke(tool_name)
-                tool_outputs.append(output)
+                output = await invoke_tool(tool_name)
+                tool_outputs.append(ToolOutput(kind=tool_name, payload=output))
             except Exception as e:
                 log_error(f"Tool execution failed for step '{step}': {e}")
 
@@ -89,11 +99,24 @@ def router_node(state: AgentState) -> dict:
     return {"route": route}
 
 
+_RETRIEVAL_ROUTES = ("rag", "structured", "calculation")
+
+
+def fan_out_after_router(state: AgentState) -> list[str] | str:
+    """
+    Retrieval routes: planner and retrieval have no data dependency (both only
+    read query + route/filters), so both run in the same superstep and re-join
+    at the CRAG evaluator. The "other" route only needs the planner.
+    """
+    if state.get("route", "other") in _RETRIEVAL_ROUTES:
+        return ["planner_node", "retrieval_node"]
+    return "planner_node"
+
+
 def route_after_planner(state: AgentState) -> str:
-    """Send to retrieval for rag/structured/calculation; direct_response for other."""
-    route = state.get("route", "other")
-    if route in ("rag", "structured", "calculation"):
-        return "retrieval_node"
+    """Retrieval routes join the CRAG evaluator; "other" answers directly."""
+    if state.get("route", "other") in _RETRIEVAL_ROUTES:
+        return "crag_evaluator_node"
     return "direct_response_node"
 
 
@@ -149,39 +172,75 @@ def decide_end(state: AgentState) -> str:
 # ----------------------------------------------------------------------
 graph = StateGraph(AgentState)
 
+# Retrieval-output cache (0 disables). extract_filters needs none: its own
+# filter cache already memoizes successful LLM classifications.
+NODE_CACHE_TTL = int(os.getenv("GRAPH_NODE_CACHE_TTL", 300))
+node_cache = NodeCache(ttl=NODE_CACHE_TTL)
+
+
+def _cache_query(state: AgentState) -> str:
+    """Cache-key form of the query: same wording, any case/padding -> same key."""
+    return (state.get("query") or "").strip().lower()
+
+
+def _retrieval_cache_key(state: AgentState) -> str:
+    # Only query + filters feed retrieval; accumulated fields stay out
+    return json.dumps(
+        [_cache_query(state), state.get("filters") or {}], sort_keys=True, default=str
+    )
+
+
+def _has_docs(update: dict) -> bool:
+    # Empty results include retrieve_docs' error fallback: never replay those
+    return bool(update.get("retrieved_docs"))
+
+
+def _add_node(name: str, fn) -> None:
+    """Register a node wrapped with per-node latency diagnostics."""
+    graph.add_node(name, timed_node(name, fn))
+
+
 # Nodes
-graph.add_node("extract_filters_node", extract_filters)
-graph.add_node("planner_node", generate_plan)
-graph.add_node("router_node", router_node)
-graph.add_node("retrieval_node", retrieve_docs)
-graph.add_node("crag_evaluator_node", evaluate_retrieval)
-graph.add_node("decompose_recompose_node", decompose_recompose)
-graph.add_node("crag_reject_node", crag_reject)
-graph.add_node("tools_node", call_tools)
-graph.add_node("structured_node", structured_extraction)
-graph.add_node("calculation_node", perform_calculation)
-graph.add_node("synthesis_node", merge_outputs)
-graph.add_node("critic_node", validate_response)
-graph.add_node("direct_response_node", direct_response)
-graph.add_node("finalize_node", finalize_response)
-
-
-# Flow: extract_filters (filters + route) → planner → router
+_add_node("extract_filters_node", extract_filters_entry)
+_add_node("planner_node", generate_plan)
+_add_node("router_node", router_node)
+_add_node(
+    "retrieval_node",
+    node_cache.wrap("retrieval_node", retrieve_docs, _retrieval_cache_key, _has_docs),
+)
+_add_node("crag_evaluator_node", evaluate_retrieval)
+_add_node("decompose_recompose_node", decompose_recompose)
+_add_node("crag_reject_node", crag_reject)
+_add_node("tools_node", call_tools)
+_add_node("structured_node", structured_extraction)
+_add_node("calculation_node", perform_calculation)
+_add_node("synthesis_node", merge_outputs)
+_add_node("critic_node", validate_response)
+_add_node("direct_response_node", direct_response)
+_add_node("finalize_node", finalize_response)
+
+
+# Flow: extract_filters (filters + route) → router → planner ∥ retrieval
 graph.add_edge(START, "extract_filters_node")
-graph.add_edge("extract_filters_node", "planner_node")
+graph.add_edge("extract_filters_node", "router_node")
 
-# --- Planning -> Router -> Retrieval or Direct ---
-graph.add_edge("planner_node", "router_node")
+# --- Router -> fan-out: Planner + Retrieval in parallel (or Planner only) ---
 graph.add_conditional_edges(
     "router_node",
+    fan_out_after_router,
+    ["planner_node", "retrieval_node"],
+)
+graph.add_conditional_edges(
+    "planner_node",
     route_after_planner,
     {
-        "retrieval_node": "retrieval_node",
+        "crag_evaluator_node": "crag_evaluator_node",
         "direct_response_node": "direct_response_node",
     },
 )
 
 # --- CRAG: Retrieval quality gate (evaluator → correct/ambiguous/incorrect) ---
+# Planner and retrieval finish in the same superstep, so the evaluator runs once
 graph.add_edge("retrieval_node", "crag_evaluator_node")
 graph.add_conditional_edges(
     "crag_evaluator_node",
@@ -212,8 +271,9 @@ graph.add_edge("calculation_node", "synthesis_node")
 graph.add_edge("synthesis_node", "critic_node")
 
 # --- Validation with loop control ---
+# Re-plan goes back through the router so the retry fans out again
 graph.add_conditional_edges(
-    "critic_node", decide_end, {"planner_node": "planner_node", END: "finalize_node"}
+    "critic_node", decide_end, {"planner_node": "router_node", END: "finalize_node"}
 )
 graph.add_edge("direct_response_node", "finalize_node")
 graph.add_edge("finalize_node", END)
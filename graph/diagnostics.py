@@ -0,0 +1,78 @@
+# graph/diagnostics.py
+"""
+Per-node latency diagnostics.
+
+Each graph node is wrapped with timed_node(), which adds an entry to the
+state's `diagnostics` channel:
+
+    {"<node>": {"ms": float, "calls": int, "docs_in": int, "docs_out": int}}
+
+Nodes that run more than once (validation loop) accumulate ms/calls, so the
+final state attributes wall time across extract_filters → planner → retrieval →
+synthesis → critic without any tracing backend.
+"""
+
+import inspect
+import time
+from functools import wraps
+from typing import Any, Callable, Dict
+
+
+def merge_diagnostics(
+    left: Dict[str, Dict[str, Any]] | None, right: Dict[str, Dict[str, Any]] | None
+) -> Dict[str, Dict[str, Any]]:
+    """State reducer: sum ms/calls per node, keep the latest doc counts."""
+    merged = dict(left or {})
+    for node, entry in (right or {}).items():
+        prev = merged.get(node)
+        if prev is None:
+            merged[node] = dict(entry)
+        else:
+            merged[node] = {
+                **entry,
+                "ms": round(prev["ms"] + entry["ms"], 3),
+                "calls": prev["calls"] + entry["calls"],
+            }
+    return merged
+
+
+def _entry(name: str, state: Dict, update: Any, t0: int) -> Dict[str, Dict]:
+    docs_in = len(state.get("retrieved_docs") or [])
+    docs_out = docs_in
+    if isinstance(update, dict) and "retrieved_docs" in update:
+        docs_out = len(update.get("retrieved_docs") or [])
+    return {
+        name: {
+            "ms": round((time.perf_counter_ns() - t0) / 1e6, 3),
+            "calls": 1,
+            "docs_in": docs_in,
+            "docs_out": docs_out,
+        }
+    }
+
+
+def _with_entry(update: Any, entry: Dict[str, Dict]) -> Any:
+    if not isinstance(update, dict):
+        return update
+    return {**update, "diagnostics": entry}
+
+
+def timed_node(name: str, fn: Callable) -> Callable:
+    """Wrap a (sync or async) node so its update carries a diagnostics entry."""
+    if inspect.iscoroutinefunction(fn):
+
+        @wraps(fn)
+        async def _async_node(state):
+            t0 = time.perf_counter_ns()
+            update = await fn(state)
+            return _with_entry(update, _entry(name, state, update, t0))
+
+        return _async_node
+
+    @wraps(fn)
+    def _sync_node(state):
+        t0 = time.perf_counter_ns()
+        update = fn(state)
+        return _with_entry(update, _entry(name, state, update, t0))
+
+    return _sync_node
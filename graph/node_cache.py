@@ -0,0 +1,90 @@
+# graph/node_cache.py
+"""
+Node-output cache.
+
+NodeCache.wrap() memoizes a node's state update under key_func(state) for
+`ttl` seconds. Unlike a LangGraph CachePolicy, it only stores updates that
+pass the node's `cacheable` check, so degraded results (a node that swallowed
+a Chroma / LLM error and returned an empty fallback) are recomputed on the
+next request instead of being replayed for the whole TTL.
+
+Wrap the node before timed_node() so cache hits report their own (near-zero)
+latency rather than the original run's diagnostics.
+
+Updates are copied on store and on hit (lists and the Documents in them), so
+a downstream node mutating doc.metadata can't corrupt the cached entry.
+"""
+
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Tuple
+
+_Key = Tuple[str, str]
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    if hasattr(value, "model_copy"):  # langchain Document (pydantic)
+        return value.model_copy(deep=True)
+    return value
+
+
+def _copy_update(update: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: _copy_value(v) for k, v in update.items()}
+
+
+class NodeCache:
+    """LRU + TTL store of node updates, keyed by (node name, cache key)."""
+
+    def __init__(self, ttl: float, max_size: int = 512):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[_Key, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _get(self, key: _Key) -> Dict[str, Any] | None:
+        hit = self._entries.get(key)
+        if hit is None:
+            return None
+        stored_at, update = hit
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return _copy_update(update)
+
+    def _put(self, key: _Key, update: Dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic(), _copy_update(update))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def wrap(
+        self,
+        name: str,
+        fn: Callable,
+        key_func: Callable[[Dict[str, Any]], str],
+        cacheable: Callable[[Dict[str, Any]], bool],
+    ) -> Callable:
+        """Cache an async node's update; a no-op wrapper when ttl <= 0."""
+        if self.ttl <= 0:
+            return fn
+
+        @wraps(fn)
+        async def _cached_node(state):
+            key = (name, key_func(state))
+            update = self._get(key)
+            if update is not None:
+                return update
+            update = await fn(state)
+            if isinstance(update, dict) and cacheable(update):
+                self._put(key, update)
+            return update
+
+        return _cached_node
@@ -9,7 +9,7 @@ from typing import Any, Dict, List
 
 from app.llm_config import get_llm
 from graph.prompts.loader import load_prompt
-from graph.state import AgentState
+from graph.state import AgentState, ToolOutput
 from observability.logger import log_error, log_info
 from observability.metrics import record_token_usage
 
@@ -30,7 +30,9 @@ async def perform_calculation(state: AgentState) -> Dict[str, Any]:
     if tool_outputs:
         data_parts.append("=== Previous Tool Outputs ===")
         for i, output in enumerate(tool_outputs, 1):
-            data_parts.append(f"Tool Result {i}:\n{str(output)[:600]}")
+            data_parts.append(
+                f"Tool Result {i} ({output['kind']}):\n{str(output['payload'])[:600]}"
+            )
 
     if retrieved_docs:
         data_parts.append("=== Regulatory Context ===")
@@ -72,11 +74,15 @@ async def perform_calculation(state: AgentState) -> Dict[str, Any]:
         # 3. BACKGROUND METRICS (your original helper preserved)
         asyncio.create_task(_log_calc_metrics(llm, raw_response))
 
-        return {"tool_outputs": [{"calculation_result": result}]}
+        return {"tool_outputs": [ToolOutput(kind="calculation", payload=result)]}
 
     except Exception as e:
         log_error(f"❌ [Calculation Node] Failed: {e}")
-        return {"tool_outputs": [{"calculation_result": "Error: Calculation failed."}]}
+        return {
+            "tool_outputs": [
+                ToolOutput(kind="calculation", payload="Error: Calculation failed.")
+            ]
+        }
 
 
 async def _log_calc_metrics(llm, response):
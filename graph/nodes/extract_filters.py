@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+import os
 import re
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from langchain_core.prompts import ChatPromptTemplate
 
 from app.llm_config import get_llm
 from graph.prompts.loader import load_prompt
@@ -16,6 +23,14 @@ from observability.metrics import record_token_usage
 # ----------------------------
 # Config / constants
 # ----------------------------
+# Calls arriving while a classification is in flight share the next LLM call
+# (<= 1 disables batching: one LLM call per query, as before).
+MAX_BATCH_SIZE = int(os.getenv("EXTRACT_FILTERS_MAX_BATCH", 8))
+
+# Parsed LLM output cached by normalized-query hash (0 disables)
+FILTER_CACHE_SIZE = int(os.getenv("EXTRACT_FILTERS_CACHE_SIZE", 4096))
+FILTER_CACHE_TTL = float(os.getenv("EXTRACT_FILTERS_CACHE_TTL", 3600))
+
 SUPPORTED_REGULATORS = {"BASEL", "SEC", "CFTC", "FED", "FINCEN", "FCA", "FDIC"}
 
 LATEST_RE = re.compile(
@@ -147,10 +162,8 @@ def _heuristic_filters(query: str) -> Dict[str, Any]:
     }
 
 
-def _parse_llm_json(text: str) -> Optional[Dict[str, Any]]:
+def _strip_fences(text: str) -> str:
     t = (text or "").strip()
-    if not t:
-        return None
 
     # Remove fenced blocks ```json ... ```
     if "```" in t:
@@ -160,6 +173,13 @@ def _parse_llm_json(text: str) -> Optional[Dict[str, Any]]:
             t = parts[1].strip()
             if t.lower().startswith("json"):
                 t = t[4:].strip()
+    return t
+
+
+def _parse_llm_json(text: str) -> Optional[Dict[str, Any]]:
+    t = _strip_fences(text)
+    if not t:
+        return None
 
     try:
         obj = json.loads(t)
@@ -168,6 +188,21 @@ def _parse_llm_json(text: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _parse_llm_json_array(text: str, n: int) -> Optional[List[Optional[Dict]]]:
+    """Parse a batched reply: a JSON array with exactly one object per query."""
+    t = _strip_fences(text)
+    if not t:
+        return None
+
+    try:
+        obj = json.loads(t)
+    except Exception:
+        return None
+    if not isinstance(obj, list) or len(obj) != n:
+        return None
+    return [o if isinstance(o, dict) else None for o in obj]
+
+
 def _normalize_filters(query: str, raw: Dict[str, Any]) -> Dict[str, Any]:
     """
     Normalize LLM output into EXACT schema expected by retrieval.hybrid_search:
@@ -242,6 +277,176 @@ def _normalize_filters(query: str, raw: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _resolve(query: str, raw_json: Optional[Dict[str, Any]]) -> Tuple[Dict, str]:
+    """Normalize parsed LLM output (or fall back to heuristics) into filters + route."""
+    if raw_json is None:
+        log_warning("extract_filters: LLM JSON parse failed. Using heuristics.")
+        cleaned = _heuristic_filters(query)
+        return cleaned, _heuristic_route(query, cleaned)
+
+    cleaned = _normalize_filters(query, raw_json)
+    raw_route = (raw_json.get("route") or "").strip().lower()
+    route = raw_route if raw_route in VALID_ROUTES else _heuristic_route(query, cleaned)
+    return cleaned, route
+
+
+# ----------------------------
+# LLM calls (single + micro-batched)
+# ----------------------------
+_PROMPT_TAIL = "User Query: {query}\nJSON Output:"
+_BATCH_INSTRUCTIONS = """### BATCH MODE
+The user message is a JSON array of N queries. Apply every rule above to each
+query independently and return ONLY a JSON array of exactly N objects (same
+shape as above), in the same order as the queries. No extra text. No markdown."""
+
+
+@lru_cache(maxsize=1)
+def _batch_prompt() -> ChatPromptTemplate:
+    """extract_filters prompt with the single-query tail swapped for batch mode."""
+    system = load_prompt("extract_filters").messages[0].prompt.template
+    system = system.replace(_PROMPT_TAIL, "").rstrip() + "\n\n" + _BATCH_INSTRUCTIONS
+    return ChatPromptTemplate.from_messages([("system", system), ("human", "{query}")])
+
+
+async def _llm_extract_one(query: str) -> Optional[Dict[str, Any]]:
+    llm = get_llm()
+    chain = load_prompt("extract_filters") | llm
+
+    resp = await chain.ainvoke({"query": query})
+    asyncio.create_task(_log_filter_metrics(llm, resp))
+    return _parse_llm_json(getattr(resp, "content", "") or "")
+
+
+async def _llm_extract_many(queries: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """One LLM round-trip for the whole batch; per-query calls if the reply is unusable."""
+    if len(queries) == 1:
+        return [await _llm_extract_one(queries[0])]
+
+    llm = get_llm()
+    chain = _batch_prompt() | llm
+
+    resp = await chain.ainvoke({"query": json.dumps(queries)})
+    asyncio.create_task(_log_filter_metrics(llm, resp))
+    parsed = _parse_llm_json_array(getattr(resp, "content", "") or "", len(queries))
+    if parsed is not None:
+        return parsed
+
+    log_warning(
+        f"extract_filters: batch reply unusable for {len(queries)} queries. "
+        "Falling back to per-query calls."
+    )
+    return list(await asyncio.gather(*(_llm_extract_one(q) for q in queries)))
+
+
+_Pending = List[Tuple[str, "asyncio.Future"]]
+
+# One open batch per event loop (tests / scripts may run several loops)
+_open_batches: Dict[asyncio.AbstractEventLoop, _Pending] = {}
+_in_flight: Dict[asyncio.AbstractEventLoop, int] = {}  # dispatches running
+_dispatch_tasks: Set["asyncio.Task"] = set()
+
+
+async def _dispatch(batch: _Pending) -> None:
+    try:
+        results = await _llm_extract_many([q for q, _ in batch])
+    except BaseException as e:
+        # Cancellation included: never leave a caller awaiting forever
+        for _, fut in batch:
+            if fut.done():
+                continue
+            if isinstance(e, asyncio.CancelledError):
+                fut.cancel()
+            else:
+                fut.set_exception(e)
+        if not isinstance(e, Exception):
+            raise
+        return
+
+    for (_, fut), raw_json in zip(batch, results):
+        if not fut.done():  # caller may have been cancelled (timeout)
+            fut.set_result(raw_json)
+
+
+def _flush(loop: asyncio.AbstractEventLoop) -> None:
+    batch = _open_batches.pop(loop, None)
+    if batch is None:
+        return
+    _in_flight[loop] = _in_flight.get(loop, 0) + 1
+    task = loop.create_task(_dispatch(batch))
+    _dispatch_tasks.add(task)
+    task.add_done_callback(lambda t: _on_dispatch_done(t, batch, loop))
+
+
+def _on_dispatch_done(
+    task: "asyncio.Task", batch: _Pending, loop: asyncio.AbstractEventLoop
+) -> None:
+    _dispatch_tasks.discard(task)
+    if task.cancelled():  # possibly before _dispatch ever ran
+        for _, fut in batch:
+            fut.cancel()  # no-op on already resolved futures
+    remaining = _in_flight.pop(loop) - 1
+    if remaining:
+        _in_flight[loop] = remaining
+    _flush(loop)  # callers that queued behind this dispatch
+
+
+async def _llm_extract(query: str) -> Optional[Dict[str, Any]]:
+    """
+    Coalesce concurrent calls without a timer: with no classification in
+    flight the caller is dispatched at once (no added latency); callers
+    arriving while one is in flight join an open batch, flushed when it
+    finishes (or at MAX_BATCH_SIZE). Each caller awaits its own Future,
+    resolved from the shared LLM reply. Same scheme as retrieval/batch_search.py.
+    """
+    if MAX_BATCH_SIZE <= 1:
+        return await _llm_extract_one(query)
+
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+
+    batch = _open_batches.setdefault(loop, [])
+    batch.append((query, fut))
+    if loop not in _in_flight or len(batch) >= MAX_BATCH_SIZE:
+        _flush(loop)
+
+    return await fut
+
+
+# ----------------------------
+# Result cache (same wording -> same filters/route)
+# ----------------------------
+_filter_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _cache_key(query: str) -> str:
+    return hashlib.sha1(query.strip().lower().encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    hit = _filter_cache.get(key)
+    if hit is None:
+        return None
+    stored_at, raw_json = hit
+    if time.monotonic() - stored_at > FILTER_CACHE_TTL:
+        del _filter_cache[key]
+        return None
+    _filter_cache.move_to_end(key)
+    return raw_json
+
+
+def _cache_put(key: str, raw_json: Dict[str, Any]) -> None:
+    if FILTER_CACHE_SIZE <= 0:
+        return
+    _filter_cache[key] = (time.monotonic(), raw_json)
+    _filter_cache.move_to_end(key)
+    while len(_filter_cache) > FILTER_CACHE_SIZE:
+        _filter_cache.popitem(last=False)
+
+
+def clear_filter_cache() -> None:
+    _filter_cache.clear()
+
+
 async def extract_filters(state: AgentState) -> Dict[str, Any]:
     query = (state.get("query") or "").strip()
     log_info(f"🔍 [Extract Filters] Analyzing: {query[:60]}...")
@@ -252,31 +457,20 @@ async def extract_filters(state: AgentState) -> Dict[str, Any]:
         return {"filters": filters, "route": route, "intent": route}
 
     try:
-        llm = get_llm()
-        prompt = load_prompt("extract_filters")
-        chain = prompt | llm
-
-        resp = await chain.ainvoke({"query": query})
-        raw_text = getattr(resp, "content", "") or ""
-        raw_json = _parse_llm_json(raw_text)
-
+        key = _cache_key(query)
+        raw_json = _cache_get(key)
         if raw_json is None:
-            log_warning("extract_filters: LLM JSON parse failed. Using heuristics.")
-            cleaned = _heuristic_filters(query)
-            route = _heuristic_route(query, cleaned)
+            raw_json = await _llm_extract(query)
+            if raw_json is not None:  # parse failures are retried next time
+                _cache_put(key, raw_json)
         else:
-            cleaned = _normalize_filters(query, raw_json)
-            raw_route = (raw_json.get("route") or "").strip().lower()
-            route = (
-                raw_route
-                if raw_route in VALID_ROUTES
-                else _heuristic_route(query, cleaned)
-            )
+            log_info("⚡ [Extract Filters] Cache hit")
+
+        cleaned, route = _resolve(query, raw_json)
 
         log_info(
             f"✅ [Extract Filters] Route: {route} | Filters: {list(cleaned.keys())}"
         )
-        asyncio.create_task(_log_filter_metrics(llm, resp))
         return {"filters": cleaned, "route": route, "intent": route}
 
     except Exception as e:
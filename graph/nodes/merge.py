@@ -52,7 +52,7 @@ async def merge_outputs(state: AgentState) -> Dict[str, Any]:
     docs_str = "\n\n".join(doc_entries) if doc_entries else "No documents available."
 
     tools_str = (
-        "\n\n".join(str(output) for output in tool_outputs)
+        "\n\n".join(f"[{o['kind']}]\n{o['payload']}" for o in tool_outputs)
         if tool_outputs
         else "No tool results."
     )
@@ -9,6 +9,7 @@ from typing import Any, Dict
 from graph.state import AgentState
 from observability.logger import log_error, log_info, log_warning
 from retrieval.hybrid_search import hybrid_search
+from retrieval.vector_store import await_prefetch
 
 
 async def retrieve_docs(state: AgentState) -> Dict[str, Any]:
@@ -26,6 +27,9 @@ async def retrieve_docs(state: AgentState) -> Dict[str, Any]:
     log_info(f"🔍 [RAG Node] Searching: {query[:50]}... | Filters: {filters}")
 
     try:
+        # Store was opened in the background at graph entry; wait for it off-loop
+        await await_prefetch()
+
         # Execute the optimized hybrid search
         docs = await hybrid_search(
             query=query,
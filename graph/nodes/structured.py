@@ -10,7 +10,7 @@ from pydantic import BaseModel, Field
 
 from app.llm_config import get_llm
 from graph.prompts.loader import load_prompt
-from graph.state import AgentState
+from graph.state import AgentState, ToolOutput
 from observability.logger import log_error, log_info
 from observability.metrics import record_token_usage
 
@@ -63,11 +63,11 @@ async def structured_extraction(state: AgentState) -> Dict[str, Any]:
         # Background metrics (your original helper style)
         asyncio.create_task(_log_structured_metrics(llm, response))
 
-        return {"tool_outputs": [{"structured_data": parsed.dict()}]}
+        return {"tool_outputs": [ToolOutput(kind="structured", payload=parsed.dict())]}
 
     except Exception as e:
         log_error(f"❌ [Structured Node] Critical failure: {e}")
-        return {"tool_outputs": [{"structured_data": {}}]}
+        return {"tool_outputs": [ToolOutput(kind="structured", payload={})]}
 
 
 async def _log_structured_metrics(llm, response):
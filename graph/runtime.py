@@ -0,0 +1,40 @@
+# graph/runtime.py
+"""
+Runtime Singletons
+
+Process-wide accessors for the heavy objects shared by entry-point scripts
+(run_agent, run_benchmark, evaluate_single): the compiled graph and the
+embedder. Each is built on first use and then stays memory-resident, so
+repeated callers never pay compile / model-load cost twice. (The LLM client
+is already a singleton: app.llm_config.get_llm.)
+"""
+
+from functools import lru_cache
+
+from observability.logger import log_info, log_warning
+
+
+@lru_cache(maxsize=1)
+def get_graph_app():
+    """Return the compiled LangGraph app (compiled once per process)."""
+    from graph.builder import app
+
+    return app
+
+
+@lru_cache(maxsize=1)
+def get_embedder():
+    """Return the RAG vector store's embedder (the instance the graph queries with)."""
+    from retrieval.vector_store import get_vector_store
+
+    embedder = get_vector_store().embeddings
+    log_info("🔢 [Runtime] Embedder singleton ready")
+    return embedder
+
+
+async def warmup_embedder() -> None:
+    """Pay the embedder's first-call cost outside of any timed region."""
+    try:
+        await get_embedder().aembed_query("warmup")
+    except Exception as e:
+        log_warning(f"⚠️ [Runtime] Embedder warmup failed: {e}")
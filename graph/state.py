@@ -9,12 +9,26 @@ All nodes read from and write to this state.
 import operator
 from typing import Annotated, Any, Dict, List, TypedDict
 
+from graph.diagnostics import merge_diagnostics
+
 try:
     from typing import NotRequired
 except ImportError:
     from typing_extensions import NotRequired
 
 
+class ToolOutput(TypedDict):
+    """
+    One entry in AgentState.tool_outputs.
+
+    kind: Producer tag - "calculation" | "structured" | a tool name (e.g. "treasury")
+    payload: The raw result (string, dict, ...), never stringified in-state
+    """
+
+    kind: str
+    payload: Any
+
+
 class AgentState(TypedDict):
     """
     The central state object passed between all nodes in the agent graph.
@@ -24,7 +38,7 @@ class AgentState(TypedDict):
         intent: Classified intent from classify node
         plan: List of steps generated by reasoning node
         retrieved_docs: Documents returned by RAG node (appended via operator.add)
-        tool_outputs: Cumulative results from execution nodes (appended via operator.add)
+        tool_outputs: Cumulative ToolOutput records from execution nodes (appended via operator.add)
         synthesized_response: Final coherent answer from merge node
         validation_result: Boolean result from critic/validation node
         iterations: Counter for validation loops to prevent infinite cycles
@@ -57,7 +71,7 @@ class AgentState(TypedDict):
     retrieved_docs: Annotated[List[Dict[str, Any]], operator.add]
     # CRAG: When decompose-recompose runs, refined_docs overrides retrieved_docs for synthesis
     refined_docs: NotRequired[List[Any]]
-    tool_outputs: Annotated[List[Dict[str, Any]], operator.add]
+    tool_outputs: Annotated[List[ToolOutput], operator.add]
 
     # Synthesis & Validation
     synthesized_response: str
@@ -73,3 +87,6 @@ class AgentState(TypedDict):
 
     # Optional final output
     final_output: str
+
+    # Per-node latency: {"node": {"ms", "calls", "docs_in", "docs_out"}} (graph/diagnostics.py)
+    diagnostics: NotRequired[Annotated[Dict[str, Dict[str, Any]], merge_diagnostics]]
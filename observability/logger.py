@@ -2,29 +2,36 @@
 """
 Structured Logging - Tier 1 Async Optimized
 Uses QueueHandler and a Safe Filter to prevent KeyError: 'request_id'.
+
+Keyword arguments to the log_* helpers are structured fields, e.g.
+log_info("Graph success", thread_id=tid): the file log serializes them with
+orjson as top-level JSON keys, the console appends them as one JSON object.
 """
 
 import logging
 import logging.handlers
-import os
 import queue
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict
 
-# Safe import with fallback
-try:
-    from pythonjsonlogger import jsonlogger
-
-    JSON_LOGGER_AVAILABLE = True
-except ImportError:
-    JSON_LOGGER_AVAILABLE = False
+import orjson
 
 from .tracer import RequestTracer
 
 # Use the specific name 'agent' for our application logs
 logger = logging.getLogger("agent")
 
+# Names logging refuses in `extra` (KeyError): every LogRecord attribute
+_RESERVED_FIELDS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+# Anything else on a record (besides our request_id) came from `extra`
+_RECORD_ATTRS = _RESERVED_FIELDS | {"request_id"}
+
+
+def _extra_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    return {k: v for k, v in record.__dict__.items() if k not in _RECORD_ATTRS}
+
 
 class RequestIDInterceptor(logging.Filter):
     """
@@ -39,17 +46,34 @@ class RequestIDInterceptor(logging.Filter):
         return True
 
 
-class CustomJsonFormatter(
-    jsonlogger.JsonFormatter if JSON_LOGGER_AVAILABLE else logging.Formatter
-):
-    """Safely injects request_id into JSON logs for file output."""
+class OrjsonFormatter(logging.Formatter):
+    """One JSON object per line (orjson): core record fields plus structured extras."""
 
     def format(self, record):
-        # Ensure request_id is present before JSON serialization
-        if not hasattr(record, "request_id"):
-            rid = RequestTracer.get_request_id()
-            record.request_id = rid if (rid and rid != "unknown") else "system"
-        return super().format(record)
+        payload: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
+            "level": record.levelname,
+            "name": record.name,
+            "module": record.module,
+            "lineno": record.lineno,
+            "request_id": getattr(record, "request_id", "system"),
+            "message": record.getMessage(),
+            **_extra_fields(record),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Human-readable line; structured extras appended as a single JSON object."""
+
+    def format(self, record):
+        line = super().format(record)
+        fields = _extra_fields(record)
+        if not fields:
+            return line
+        return f"{line} {orjson.dumps(fields, default=str).decode()}"
 
 
 def setup_structured_logging(log_level: int = logging.INFO) -> None:
@@ -61,24 +85,17 @@ def setup_structured_logging(log_level: int = logging.INFO) -> None:
 
     # 2. Console Handler (Standard Output)
     console_handler = logging.StreamHandler(sys.stdout)
-    console_formatter = logging.Formatter(
+    console_formatter = ConsoleFormatter(
         "%(asctime)s | %(levelname)-8s | %(name)s | %(request_id)s | %(message)s"
     )
     console_handler.setFormatter(console_formatter)
     console_handler.addFilter(safety_filter)
 
-    # 3. File Handler (Rotating)
-    log_file = "logs/agent.jsonl" if JSON_LOGGER_AVAILABLE else "logs/agent.log"
+    # 3. File Handler (Rotating, JSON lines)
     file_handler = logging.handlers.RotatingFileHandler(
-        log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
+        "logs/agent.jsonl", maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
     )
-
-    if JSON_LOGGER_AVAILABLE:
-        file_formatter = CustomJsonFormatter(
-            "%(timestamp)s %(level)s %(name)s %(module)s %(lineno)d %(request_id)s %(message)s"
-        )
-    else:
-        file_formatter = console_formatter
+    file_formatter = OrjsonFormatter()
 
     file_handler.setFormatter(file_formatter)
     file_handler.addFilter(safety_filter)
@@ -103,7 +120,7 @@ def setup_structured_logging(log_level: int = logging.INFO) -> None:
 
     root_logger.addHandler(queue_handler)
 
-    log_info(f"🚀 Logging stabilized (JSON: {JSON_LOGGER_AVAILABLE})")
+    log_info("🚀 Logging stabilized", file_log="logs/agent.jsonl")
 
 
 # =============================================================================
@@ -112,8 +129,14 @@ def setup_structured_logging(log_level: int = logging.INFO) -> None:
 
 
 def _prepare_extra(kwargs: Dict[str, Any]) -> Dict[str, Any]:
-    """Ensures request_id is injected into the extra dict."""
-    extra = kwargs.get("extra", {})
+    """
+    Ensures request_id is injected into the extra dict. Fields that collide
+    with LogRecord attributes (name, msg, module, ...) are stored as field_<name>.
+    """
+    extra = {
+        (f"field_{k}" if k in _RESERVED_FIELDS else k): v
+        for k, v in kwargs.get("extra", {}).items()
+    }
     if "request_id" not in extra:
         extra["request_id"] = RequestTracer.get_request_id()
 
@@ -121,26 +144,38 @@ def _prepare_extra(kwargs: Dict[str, Any]) -> Dict[str, Any]:
     reserved = ["exc_info", "stack_info", "extra"]
     for k, v in kwargs.items():
         if k not in reserved:
-            extra[k] = v
+            extra[f"field_{k}" if k in _RESERVED_FIELDS else k] = v
     return extra
 
 
-def log_debug(message: str, **kwargs: Any) -> None:
+def log_debug(message: str, *args: Any, **kwargs: Any) -> None:
     """Logs at DEBUG level with request correlation."""
-    logger.debug(message, extra=_prepare_extra(kwargs))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message, *args, extra=_prepare_extra(kwargs))
 
 
-def log_info(message: str, **kwargs: Any) -> None:
-    """Logs at INFO level with request correlation."""
-    logger.info(message, extra=_prepare_extra(kwargs))
+def log_info(message: str, *args: Any, **kwargs: Any) -> None:
+    """
+    Logs at INFO level with request correlation.
+
+    `args` are %-format arguments merged into `message` only if the record is
+    emitted; `kwargs` are structured fields, e.g.
+    log_info("Graph success", thread_id=thread_id).
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(message, *args, extra=_prepare_extra(kwargs))
 
 
-def log_warning(message: str, **kwargs: Any) -> None:
+def log_warning(message: str, *args: Any, **kwargs: Any) -> None:
     """Logs at WARNING level with request correlation."""
-    logger.warning(message, extra=_prepare_extra(kwargs))
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(message, *args, extra=_prepare_extra(kwargs))
 
 
-def log_error(message: str, **kwargs: Any) -> None:
+def log_error(message: str, *args: Any, **kwargs: Any) -> None:
     """Logs at ERROR level with request correlation."""
-    exc_info_val = kwargs.get("exc_info", False)
-    logger.error(message, exc_info=exc_info_val, extra=_prepare_extra(kwargs))
+    if logger.isEnabledFor(logging.ERROR):
+        exc_info_val = kwargs.get("exc_info", False)
+        logger.error(
+            message, *args, exc_info=exc_info_val, extra=_prepare_extra(kwargs)
+        )
@@ -0,0 +1,187 @@
+# retrieval/batch_search.py
+"""
+Batched vector search for concurrent hybrid_search calls.
+
+Vector lookups with the same (store, k, where) are coalesced without a timer:
+when no search for that key is in flight, a caller is dispatched immediately
+(an uncontended search never waits). Callers arriving while one is in flight
+join an open batch, which is flushed as soon as the in-flight search finishes
+(or once it reaches MAX_BATCH_SIZE) and issues ONE Chroma query over all of
+its query embeddings. Each caller awaits its own Future, resolved with its
+slice of the result. A batch of one goes through the normal retriever path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from langchain_core.documents import Document
+
+from observability.logger import log_info
+
+# <= 1 disables batching (one retriever call per query, as before)
+MAX_BATCH_SIZE = int(os.getenv("HYBRID_MAX_BATCH", 16))
+
+# (store, k, where as canonical JSON) -> callers sharing one Chroma query
+_Key = Tuple[int, int, Optional[str]]
+_Pending = List[Tuple[str, "asyncio.Future[List[Document]]"]]
+
+
+class _Batch:
+    __slots__ = ("store", "k", "where", "pending")
+
+    def __init__(self, store: Any, k: int, where: Optional[Dict[str, Any]]):
+        self.store = store
+        self.k = k
+        self.where = where
+        self.pending: _Pending = []
+
+
+_LoopKey = Tuple[asyncio.AbstractEventLoop, _Key]
+
+_open_batches: Dict[_LoopKey, _Batch] = {}
+_in_flight: Dict[_LoopKey, int] = {}  # dispatches running per key
+_dispatch_tasks: Set["asyncio.Task"] = set()
+
+
+def _search_kwargs(k: int, where: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    # LangChain's retriever expects 'filter'
+    return {"k": k, "filter": where} if where else {"k": k}
+
+
+async def _search_one(
+    store: Any, query: str, k: int, where: Optional[Dict[str, Any]]
+) -> List[Document]:
+    return await store.as_retriever(search_kwargs=_search_kwargs(k, where)).ainvoke(
+        query
+    )
+
+
+async def _search_many(
+    store: Any, queries: List[str], k: int, where: Optional[Dict[str, Any]]
+) -> List[List[Document]]:
+    """
+    One Chroma query for all `queries`; results in input order.
+
+    langchain_chroma has no public multi-vector search, so the batched query
+    goes through the store's Chroma collection when it exposes one; any other
+    store falls back to the public similarity_search_by_vector per query
+    (still sharing the concurrent embedding calls).
+    """
+    embedder = store.embeddings
+    vectors = await asyncio.gather(*(embedder.aembed_query(q) for q in queries))
+
+    collection = getattr(store, "_collection", None)
+    if not callable(getattr(collection, "query", None)):
+        kwargs = {"filter": where} if where else {}
+        return list(
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        store.similarity_search_by_vector, vec, k=k, **kwargs
+                    )
+                    for vec in vectors
+                )
+            )
+        )
+
+    query_kwargs: Dict[str, Any] = {
+        "query_embeddings": list(vectors),
+        "n_results": k,
+        "include": ["documents", "metadatas"],
+    }
+    if where:
+        query_kwargs["where"] = where
+    raw = await asyncio.to_thread(collection.query, **query_kwargs)
+
+    documents = raw.get("documents") or [[] for _ in queries]
+    metadatas = raw.get("metadatas") or [[] for _ in queries]
+    ids = raw.get("ids") or [[] for _ in queries]
+    # Same conversion as langchain_chroma's similarity_search (id included)
+    return [
+        [
+            Document(id=doc_id, page_content=text or "", metadata=meta or {})
+            for text, meta, doc_id in zip(
+                texts, metas or [{}] * len(texts), row_ids or [None] * len(texts)
+            )
+        ]
+        for texts, metas, row_ids in zip(documents, metadatas, ids)
+    ]
+
+
+async def _dispatch(batch: _Batch) -> None:
+    queries = [q for q, _ in batch.pending]
+    try:
+        if len(queries) == 1:
+            results = [await _search_one(batch.store, queries[0], batch.k, batch.where)]
+        else:
+            log_info("📦 [Batch Search] %d queries in one search", len(queries))
+            results = await _search_many(batch.store, queries, batch.k, batch.where)
+    except BaseException as e:
+        # Cancellation included: never leave a caller awaiting forever
+        for _, fut in batch.pending:
+            if fut.done():
+                continue
+            if isinstance(e, asyncio.CancelledError):
+                fut.cancel()
+            else:
+                fut.set_exception(e)
+        if not isinstance(e, Exception):
+            raise
+        return
+
+    for (_, fut), docs in zip(batch.pending, results):
+        if not fut.done():  # caller may have been cancelled
+            fut.set_result(docs)
+
+
+def _flush(loop: asyncio.AbstractEventLoop, key: _Key) -> None:
+    batch = _open_batches.pop((loop, key), None)
+    if batch is None:
+        return
+    _in_flight[(loop, key)] = _in_flight.get((loop, key), 0) + 1
+    task = loop.create_task(_dispatch(batch))
+    _dispatch_tasks.add(task)
+    task.add_done_callback(lambda t: _on_dispatch_done(t, batch, loop, key))
+
+
+def _on_dispatch_done(
+    task: "asyncio.Task", batch: _Batch, loop: asyncio.AbstractEventLoop, key: _Key
+) -> None:
+    _dispatch_tasks.discard(task)
+    if task.cancelled():  # possibly before _dispatch ever ran
+        for _, fut in batch.pending:
+            fut.cancel()  # no-op on already resolved futures
+    remaining = _in_flight.pop((loop, key)) - 1
+    if remaining:
+        _in_flight[(loop, key)] = remaining
+    _flush(loop, key)  # callers that queued behind this dispatch
+
+
+async def vector_search(
+    store: Any, query: str, k: int, where: Optional[Dict[str, Any]] = None
+) -> List[Document]:
+    """Top-k vector search for `query`, coalesced with concurrent callers."""
+    if MAX_BATCH_SIZE <= 1:
+        return await _search_one(store, query, k, where)
+
+    try:
+        where_key = json.dumps(where, sort_keys=True, default=str) if where else None
+    except (TypeError, ValueError):
+        return await _search_one(store, query, k, where)
+
+    loop = asyncio.get_running_loop()
+    key: _Key = (id(store), k, where_key)
+    fut = loop.create_future()
+
+    batch = _open_batches.get((loop, key))
+    if batch is None:
+        batch = _open_batches[(loop, key)] = _Batch(store, k, where)
+    batch.pending.append((query, fut))
+    if (loop, key) not in _in_flight or len(batch.pending) >= MAX_BATCH_SIZE:
+        _flush(loop, key)
+
+    return await fut
@@ -23,6 +23,7 @@ Filters (input):
 
 Adds:
 - "latest" mode: bias candidate pool + final results toward newest by date/year.
+- Concurrent vector lookups are coalesced into one Chroma query (batch_search.py).
 """
 
 import asyncio
@@ -30,7 +31,9 @@ import os
 import re
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from langchain_cohere import CohereRerank
 from langchain_community.retrievers import BM25Retriever
@@ -38,6 +41,7 @@ from langchain_core.documents import Document
 
 from observability.logger import log_error, log_info, log_warning
 
+from .batch_search import vector_search
 from .vector_store import get_vector_store
 
 DEFAULT_TOP_K = int(os.getenv("HYBRID_TOP_K", 8))
@@ -108,7 +112,93 @@ def _build_year_condition(year: Any) -> Optional[Dict[str, Any]]:
     return {"year": y_str} if y_str else None
 
 
+# Filter keys that contribute to the Chroma where clause (order is the cache key layout)
+_WHERE_LIST_KEYS = ("regulators", "categories", "types", "spiders", "source_types")
+_FROZEN_DICT = object()  # tag marking a frozen dict inside a cache key
+
+
+def _freeze_filter_value(val: Any) -> Any:
+    """Convert a filter value into a hashable equivalent for the where-cache key."""
+    if isinstance(val, dict):
+        return (_FROZEN_DICT,) + tuple(
+            sorted((str(k), _freeze_filter_value(v)) for k, v in val.items())
+        )
+    if isinstance(val, (list, tuple, set)):
+        return tuple(_freeze_filter_value(v) for v in val)
+    return val
+
+
+def _thaw_filter_value(val: Any) -> Any:
+    """Inverse of _freeze_filter_value (tuples back to lists/dicts)."""
+    if isinstance(val, tuple):
+        if val and val[0] is _FROZEN_DICT:
+            return {k: _thaw_filter_value(v) for k, v in val[1:]}
+        return [_thaw_filter_value(v) for v in val]
+    return val
+
+
+@lru_cache(maxsize=256)
+def _build_where_cached(
+    frozen_filters: Tuple[Any, ...],
+) -> Optional[Mapping[str, Any]]:
+    """
+    Memoized where-clause builder keyed on the frozen filter shape.
+    Returns a read-only mapping so a cached clause can never be mutated by a caller.
+    """
+    regulators, categories, types_, spiders, source_types, juris, year = (
+        _thaw_filter_value(v) for v in frozen_filters
+    )
+    where = _build_where_uncached(
+        {
+            "regulators": regulators,
+            "categories": categories,
+            "types": types_,
+            "spiders": spiders,
+            "source_types": source_types,
+            "jurisdiction": juris,
+            "year": year,
+        }
+    )
+    return MappingProxyType(where) if where else None
+
+
 def _build_where(filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Cached front-end for _build_where_uncached.
+
+    Repeated filter shapes (same regulators/year/types/...) skip the normalize +
+    condition-building pass. Chroma validates `where` with isinstance(dict/list),
+    so the cached clause is handed back as a fresh copy down to its nested
+    $and / $in lists: callers can never mutate the cached one.
+    """
+    if not filters:
+        return None
+    try:
+        frozen = tuple(
+            _freeze_filter_value(filters.get(key)) for key in _WHERE_LIST_KEYS
+        ) + (
+            _freeze_filter_value(filters.get("jurisdiction")),
+            _freeze_filter_value(filters.get("year")),
+        )
+        cached = _build_where_cached(frozen)
+    except TypeError:
+        # Unhashable filter value (unexpected shape): build without caching
+        return _build_where_uncached(filters)
+    return _copy_clause(cached) if cached else None
+
+
+def _copy_clause(value: Any) -> Any:
+    """Copy the dicts/lists of a where clause; leaves are immutable scalars."""
+    if isinstance(value, Mapping):
+        return {k: _copy_clause(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_clause(v) for v in value]
+    return value
+
+
+def _build_where_uncached(
+    filters: Optional[Dict[str, Any]],
+) -> Optional[Dict[str, Any]]:
     """
     Approach A only:
       - regulators -> regulator ($in)
@@ -279,12 +369,6 @@ async def hybrid_search(
         if where:
             log_info(f"🎯 Chroma where: {where}")
 
-        # Vector retriever (LangChain expects 'filter')
-        search_kwargs: Dict[str, Any] = {"k": candidate_k}
-        if where:
-            search_kwargs["filter"] = where
-        vector_retriever = store.as_retriever(search_kwargs=search_kwargs)
-
         # BM25 candidate pool (Chroma get expects 'where')
         pool_limit = (
             max(DEFAULT_LATEST_POOL, candidate_k * 8)
@@ -309,7 +393,7 @@ async def hybrid_search(
 
         if not docs_raw:
             log_warning("📭 No docs in BM25 pool. Returning vector-only results.")
-            return await vector_retriever.ainvoke(query)
+            return await vector_search(store, query, candidate_k, where)
 
         # Zip defensively
         if len(metas_raw) != len(docs_raw):
@@ -325,7 +409,7 @@ async def hybrid_search(
             log_warning(
                 "📭 BM25 pool empty after cleaning. Returning vector-only results."
             )
-            return await vector_retriever.ainvoke(query)
+            return await vector_search(store, query, candidate_k, where)
 
         # Latest-mode: sort candidate pool first to make BM25 reflect “latest”
         if latest_mode:
@@ -338,7 +422,7 @@ async def hybrid_search(
 
         bm25_results, vector_results = await asyncio.gather(
             bm25_retriever.ainvoke(query),
-            vector_retriever.ainvoke(query),
+            vector_search(store, query, candidate_k, where),
         )
 
         fused = await apply_rrf(
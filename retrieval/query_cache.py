@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Semantic Query Cache - LRU + TTL keyed by query embeddings
+
+Near-duplicate prompts (repeats / light rephrasings) are answered from memory
+instead of re-running the full graph (retrieval + LLM calls).
+
+- Cosine top-1 lookup over a single float32 matrix (one BLAS matmul, no Python loop)
+- LRU eviction via OrderedDict.popitem(last=False)
+- Per-entry TTL; expired hits count as misses and are evicted
+- Thread-safe (RLock) so it can be shared with worker threads
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", 512))
+DEFAULT_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", 600))
+DEFAULT_SIMILARITY_THRESHOLD = float(os.getenv("QUERY_CACHE_THRESHOLD", 0.95))
+
+_INITIAL_CAPACITY = 16
+
+
+@dataclass
+class CacheEntry:
+    response: str
+    retrieved_docs: List[Any] = field(default_factory=list)
+    timestamp: float = field(default_factory=time.monotonic)
+
+
+def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+    """L2-normalize to float32 so a dot product is cosine similarity."""
+    vec = np.asarray(embedding, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vec))
+    if not vec.size or norm == 0.0:
+        return None
+    return vec / norm
+
+
+class QueryCache:
+    """Embedding-keyed LRU + TTL cache for agent responses."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_CACHE_TTL,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ):
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+
+        self._lock = threading.RLock()
+        # slot index (row in _matrix) -> entry, in LRU order (oldest first)
+        self._entries: "OrderedDict[int, CacheEntry]" = OrderedDict()
+        self._matrix: Optional[np.ndarray] = None
+        self._active: Optional[np.ndarray] = None
+        self._free_slots: List[int] = []
+        self._next_slot = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._matrix = None
+            self._active = None
+            self._free_slots = []
+            self._next_slot = 0
+
+    def _expired(self, entry: CacheEntry) -> bool:
+        return (time.monotonic() - entry.timestamp) > self.ttl_seconds
+
+    def _evict(self, slot: int) -> None:
+        self._entries.pop(slot, None)
+        if self._active is not None:
+            self._active[slot] = False
+        self._free_slots.append(slot)
+        self.evictions += 1
+
+    def _allocate_slot(self, dim: int) -> int:
+        if self._matrix is None:
+            capacity = min(_INITIAL_CAPACITY, self.max_size)
+            self._matrix = np.zeros((capacity, dim), dtype=np.float32)
+            self._active = np.zeros(capacity, dtype=bool)
+
+        if self._free_slots:
+            return self._free_slots.pop()
+
+        if len(self._entries) >= self.max_size:
+            oldest, _ = next(iter(self._entries.items()))
+            self._evict(oldest)
+            return self._free_slots.pop()
+
+        if self._next_slot >= self._matrix.shape[0]:
+            # Grow by doubling (bounded by max_size) to keep lookups a single matmul
+            capacity = min(self._matrix.shape[0] * 2, self.max_size)
+            grown = np.zeros((capacity, dim), dtype=np.float32)
+            grown[: self._matrix.shape[0]] = self._matrix
+            active = np.zeros(capacity, dtype=bool)
+            active[: self._active.shape[0]] = self._active
+            self._matrix, self._active = grown, active
+
+        slot = self._next_slot
+        self._next_slot += 1
+        return slot
+
+    def get(self, embedding: Sequence[float]) -> Optional[CacheEntry]:
+        """Return the most similar live entry if it clears the threshold."""
+        q = _normalize(embedding)
+        with self._lock:
+            if q is None or not self._entries or self._matrix is None:
+                self.misses += 1
+                return None
+            if q.shape[0] != self._matrix.shape[1]:
+                self.misses += 1
+                return None
+
+            scores = self._matrix[: self._next_slot] @ q
+            scores[~self._active[: self._next_slot]] = -np.inf
+            slot = int(np.argmax(scores))
+
+            if scores[slot] < self.threshold:
+                self.misses += 1
+                return None
+
+            entry = self._entries[slot]
+            if self._expired(entry):
+                self._evict(slot)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(slot)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        embedding: Sequence[float],
+        response: str,
+        retrieved_docs: Optional[List[Any]] = None,
+    ) -> None:
+        q = _normalize(embedding)
+        if q is None:
+            return
+        with self._lock:
+            if self._matrix is not None and q.shape[0] != self._matrix.shape[1]:
+                # Embedding model changed underneath us: start over
+                self.clear()
+
+            slot = self._allocate_slot(q.shape[0])
+            self._matrix[slot] = q
+            self._active[slot] = True
+            self._entries[slot] = CacheEntry(
+                response=response, retrieved_docs=list(retrieved_docs or [])
+            )
+            self._entries.move_to_end(slot)
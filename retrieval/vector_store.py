@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import os
+import threading
 from pathlib import Path
 from typing import List
 
@@ -13,7 +15,7 @@ from langchain_chroma import Chroma
 from langchain_community.vectorstores.utils import filter_complex_metadata
 from langchain_core.documents import Document
 
-from observability.logger import log_error, log_info, log_warning
+from observability.logger import log_debug, log_error, log_info, log_warning
 
 from .embeddings import get_embeddings
 
@@ -37,12 +39,21 @@ else:
 
 COLLECTION_NAME = os.getenv("CHROMA_COLLECTION_NAME", "financial_regulation")
 
+# Open the store in the background at graph entry (see prefetch_vector_store)
+VECTOR_STORE_PREFETCH = os.getenv("VECTOR_STORE_PREFETCH", "true").lower() == "true"
+
 _vector_store: Chroma | None = None
+_init_lock = threading.Lock()  # prefetch thread vs. direct callers
+_prefetch: asyncio.Future | None = None
 
 
 def get_vector_store() -> Chroma:
     global _vector_store
-    if _vector_store is None:
+    if _vector_store is not None:
+        return _vector_store
+    with _init_lock:
+        if _vector_store is not None:
+            return _vector_store
         try:
             os.makedirs(PERSIST_DIRECTORY, exist_ok=True)
             log_info(f"Initializing Chroma | Collection: {COLLECTION_NAME}")
@@ -62,6 +73,44 @@ def get_vector_store() -> Chroma:
     return _vector_store
 
 
+def _on_prefetch_done(fut: asyncio.Future) -> None:
+    global _prefetch
+    if fut.cancelled() or fut.exception() is not None:
+        # The real get_vector_store() call will surface (and log) the error
+        err = "cancelled" if fut.cancelled() else fut.exception()
+        log_debug(f"Vector store prefetch failed: {err}")
+    if _prefetch is fut:  # finished either way: a later reset may prefetch again
+        _prefetch = None
+
+
+def prefetch_vector_store() -> None:
+    """
+    Start opening the store in a worker thread so the cold Chroma/HNSW open
+    overlaps the first LLM round-trips. No-op once open or already in flight
+    on this event loop.
+    """
+    global _prefetch
+    if not VECTOR_STORE_PREFETCH or _vector_store is not None:
+        return
+    loop = asyncio.get_running_loop()
+    if _prefetch is not None and _prefetch.get_loop() is loop:
+        return
+    # None, or left over from another loop (whose callbacks may never run)
+    _prefetch = loop.run_in_executor(None, get_vector_store)
+    _prefetch.add_done_callback(_on_prefetch_done)
+
+
+async def await_prefetch() -> None:
+    """Wait (without blocking the loop) for an in-flight prefetch; errors are ignored."""
+    fut = _prefetch
+    if fut is None or fut.get_loop() is not asyncio.get_running_loop():
+        return
+    try:
+        await asyncio.shield(fut)
+    except Exception:
+        pass
+
+
 def _sha1(s: str) -> str:
     return hashlib.sha1(s.encode("utf-8")).hexdigest()
 
@@ -170,11 +219,12 @@ def add_documents(docs: List[Document], batch_size: int = 500) -> None:
 
 def clear_collection() -> None:
     """Wipes the DB collection safely."""
-    global _vector_store
+    global _vector_store, _prefetch
     try:
         store = get_vector_store()
         store.delete_collection()
         _vector_store = None
+        _prefetch = None
         log_warning(f"🗑️ Collection '{COLLECTION_NAME}' deleted.")
     except Exception as e:
         log_error(f"Clear failed: {e}")
@@ -23,7 +23,8 @@ def diagnose_cftc():
     client = chromadb.PersistentClient(path=abs_path)
     col = client.get_collection(name=collection_name)
 
-    cftc_docs = col.get(where={"regulator": "CFTC"}, limit=10)
+    # Only metadata is printed; skip the documents/embeddings payload
+    cftc_docs = col.get(where={"regulator": "CFTC"}, limit=10, include=["metadatas"])
 
     total_cftc = len(cftc_docs.get("ids", []))
     total_docs = col.count()
@@ -12,6 +12,8 @@ Usage:
   python3.11 scripts/diagnose_chroma.py --regulator BASEL
   python3.11 scripts/diagnose_chroma.py --regulator BASEL --category policy
   python3.11 scripts/diagnose_chroma.py --regulator CFTC --type press_release --year 2026
+  python3.11 scripts/diagnose_chroma.py --regulator FCA --year 2024 --count-only
+  python3.11 scripts/diagnose_chroma.py --migrate-year-ints
 
 Env:
   CHROMA_PERSIST_DIR (default: data/chroma_db)
@@ -19,12 +21,15 @@ Env:
 """
 
 import argparse
+import asyncio
+import heapq
+import operator
 import os
-from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import chromadb
+import numpy as np
 from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -38,13 +43,19 @@ def _resolve_chroma() -> tuple[str, str]:
     return abs_path, collection_name
 
 
+MIGRATE_PAGE_SIZE = 5000
+MIGRATE_BATCH_SIZE = 500
+SAMPLE_PAGE_SIZE = 128
+SAMPLE_TABLE_ROWS = 8
+
+
 def _normalize_year_condition(year: str) -> Dict[str, Any]:
     """
-    Match year stored as int OR str.
+    Match year stored as int (Approach A schema).
+    Legacy string years can be converted with --migrate-year-ints.
     """
     try:
-        y = int(year)
-        return {"$or": [{"year": y}, {"year": str(y)}]}
+        return {"year": int(year)}
     except (ValueError, TypeError):
         return {"year": str(year)}
 
@@ -73,6 +84,51 @@ def _build_where(
     return {"$and": conditions}
 
 
+def _iter_pages(
+    col: Any,
+    where: Optional[Dict[str, Any]],
+    page: int = SAMPLE_PAGE_SIZE,
+    total: Optional[int] = None,
+    include: Optional[List[str]] = None,
+) -> Iterator[Tuple[List[str], List[Dict[str, Any]]]]:
+    """
+    Yield (ids, metadatas) pages via limit/offset until `total` rows (or the end
+    of the collection) so only one page of metadata is resident at a time.
+    """
+    include = include or ["metadatas"]
+    offset = 0
+    while total is None or offset < total:
+        size = page if total is None else min(page, total - offset)
+        batch = col.get(
+            **({"where": where} if where else {}),
+            limit=size,
+            offset=offset,
+            include=include,
+        )
+        ids = batch.get("ids") or []
+        if not ids:
+            return
+        yield ids, batch.get("metadatas") or []
+        offset += len(ids)
+        if len(ids) < size:
+            return
+
+
+def _distribution(values: List[str], topn: int) -> List[Tuple[str, int]]:
+    """
+    Top-`topn` (value, count) pairs by descending count. Values are repr strings
+    so mixed str/int/None metadata sorts as one fixed-width unicode array and the
+    hash/sort runs in C via np.unique instead of per-item Counter updates.
+    heapq.nlargest keeps the selection O(K log topn) for high-cardinality fields.
+    """
+    if not values:
+        return []
+    keys, counts = np.unique(np.array(values, dtype=str), return_counts=True)
+    return heapq.nlargest(
+        topn, zip(keys.tolist(), counts.tolist()), key=operator.itemgetter(1)
+    )
+
+
 def _print_meta(meta: Dict[str, Any]) -> None:
     print("\n--- 🔍 METADATA SAMPLE ---")
     for key in sorted(meta.keys()):
@@ -122,12 +178,108 @@ def _schema_checks(meta: Dict[str, Any]) -> None:
     print("✅ Done.")
 
 
-def diagnose(
+def migrate_year_ints(
+    page_size: int = MIGRATE_PAGE_SIZE, batch_size: int = MIGRATE_BATCH_SIZE
+) -> int:
+    """
+    Rewrite digit-only string years (e.g. "2024") as ints so year filters need a
+    single predicate. Streams metadata in pages and updates in batches.
+    Returns the number of migrated records.
+    """
+    abs_path, collection_name = _resolve_chroma()
+    print(f"📂 Path: {abs_path}")
+    print(f"📦 Collection: {collection_name}")
+
+    if not os.path.exists(abs_path):
+        print("❌ ERROR: CHROMA_PERSIST_DIR path not found.")
+        return 0
+
+    client = chromadb.PersistentClient(path=abs_path)
+    try:
+        col = client.get_collection(name=collection_name)
+    except Exception as e:
+        print(f"❌ ERROR: Could not access collection '{collection_name}'.")
+        print(f"Details: {e}")
+        return 0
+
+    batch_ids: List[str] = []
+    batch_metas: List[Dict[str, Any]] = []
+    migrated = 0
+    scanned = 0
+
+    def _flush() -> None:
+        nonlocal migrated
+        if batch_ids:
+            col.update(ids=list(batch_ids), metadatas=list(batch_metas))
+            migrated += len(batch_ids)
+            batch_ids.clear()
+            batch_metas.clear()
+
+    for ids, metadatas in _iter_pages(col, None, page=page_size):
+        for doc_id, md in zip(ids, metadatas):
+            y = (md or {}).get("year")
+            if isinstance(y, str) and y.strip().isdigit():
+                batch_ids.append(doc_id)
+                batch_metas.append({**md, "year": int(y.strip())})
+                if len(batch_ids) >= batch_size:
+                    _flush()
+        scanned += len(ids)
+
+    _flush()
+    print(f"✅ Scanned {scanned} documents | migrated {migrated} string years to int")
+    return migrated
+
+
+def _sample_columns(
+    col: Any, where: Optional[Dict[str, Any]], limit: int
+) -> Tuple[List[Tuple[str, Dict[str, Any]]], Dict[str, List[str]], int]:
+    """
+    Page through up to `limit` metadatas and collect the distribution columns.
+    Returns (head rows for the meta sample / id table, columns, sampled count).
+    """
+    columns: Dict[str, List[str]] = {
+        "regulator": [],
+        "type": [],
+        "category": [],
+        "year_type": [],
+    }
+    head: List[Tuple[str, Dict[str, Any]]] = []
+    sampled = 0
+
+    for ids, metadatas in _iter_pages(col, where, total=limit):
+        mds = [md or {} for md in metadatas]
+        if len(head) < SAMPLE_TABLE_ROWS:
+            head.extend(list(zip(ids, mds))[: SAMPLE_TABLE_ROWS - len(head)])
+        columns["regulator"].extend(repr(md.get("regulator")) for md in mds)
+        columns["type"].extend(repr(md.get("type")) for md in mds)
+        columns["category"].extend(repr(md.get("category")) for md in mds)
+        columns["year_type"].extend(repr(type(md.get("year")).__name__) for md in mds)
+        sampled += len(mds)
+
+    return head, columns, sampled
+
+
+def _fetch_preview(col: Any, where: Optional[Dict[str, Any]]) -> str:
+    """Single document body for the content preview only."""
+    preview = col.get(
+        **({"where": where} if where else {}), limit=1, include=["documents"]
+    )
+    return (preview.get("documents") or [""])[0] or ""
+
+
+def _probe(col: Any, where: Optional[Dict[str, Any]]) -> bool:
+    """ids-only probe: include=[] skips metadata/document deserialization."""
+    probe = col.get(**({"where": where} if where else {}), limit=1, include=[])
+    return bool(probe.get("ids"))
+
+
+async def diagnose(
     limit: int,
     regulator: str | None,
     category: str | None,
     type_: str | None,
     year: str | None,
+    count_only: bool = False,
 ) -> None:
     abs_path, collection_name = _resolve_chroma()
 
@@ -147,77 +299,79 @@ def diagnose(
         print(f"Details: {e}")
         return
 
-    try:
-        count = col.count()
-        print(f"✅ SUCCESS! Found {count} documents.")
-    except Exception as e:
-        print(f"❌ ERROR: Could not count docs. Details: {e}")
+    where = _build_where(regulator, category, type_, year)
+
+    # count / sample / preview are independent reads: overlap them in worker
+    # threads so wall time approaches the slowest one instead of the sum.
+    if count_only:
+        count, matched = await asyncio.gather(
+            asyncio.to_thread(col.count),
+            asyncio.to_thread(_probe, col, where),
+            return_exceptions=True,
+        )
+    else:
+        count, sample, doc0 = await asyncio.gather(
+            asyncio.to_thread(col.count),
+            asyncio.to_thread(_sample_columns, col, where, limit),
+            asyncio.to_thread(_fetch_preview, col, where),
+            return_exceptions=True,
+        )
+
+    if isinstance(count, BaseException):
+        print(f"❌ ERROR: Could not count docs. Details: {count}")
         return
+    print(f"✅ SUCCESS! Found {count} documents.")
 
     if count <= 0:
         print("📭 Collection is empty.")
         return
 
-    where = _build_where(regulator, category, type_, year)
     if where:
         print(f"\n🎯 WHERE filter: {where}")
 
-    try:
-        # IMPORTANT: do NOT include "ids" in include list (Chroma rejects it).
-        include = ["metadatas", "documents"]
-        if where:
-            sample = col.get(where=where, limit=min(limit, 500), include=include)
-        else:
-            sample = col.get(limit=min(limit, 500), include=include)
-    except Exception as e:
-        print(f"❌ ERROR: Could not fetch sample docs. Details: {e}")
+    if count_only:
+        if isinstance(matched, BaseException):
+            print(f"❌ ERROR: Could not probe collection. Details: {matched}")
+            return
+        print(f"matched={matched}")
         return
 
-    metadatas = sample.get("metadatas") or []
-    documents = sample.get("documents") or []
-    ids = sample.get("ids") or []  # Chroma returns ids automatically
+    if isinstance(sample, BaseException):
+        print(f"❌ ERROR: Could not fetch sample docs. Details: {sample}")
+        return
+    head, columns, sampled = sample
 
-    if not metadatas:
+    if not sampled:
         print("📭 No documents returned for this filter/sample.")
         return
 
-    meta0 = metadatas[0] or {}
+    meta0 = head[0][1]
     _print_meta(meta0)
     _schema_checks(meta0)
 
-    doc0 = documents[0] if documents else ""
+    if isinstance(doc0, BaseException):
+        print(f"⚠️ Could not fetch content preview. Details: {doc0}")
+        doc0 = ""
     if doc0:
         print("\n--- 🧾 CONTENT PREVIEW ---")
         print(doc0[:500].replace("\n", "\\n"))
 
-    print(f"\n--- 📊 DISTRIBUTIONS (from {len(metadatas)} sampled docs) ---")
-    reg_ctr = Counter()
-    type_ctr = Counter()
-    cat_ctr = Counter()
-    year_types = Counter()
-
-    for md in metadatas:
-        md = md or {}
-        reg_ctr[md.get("regulator")] += 1
-        type_ctr[md.get("type")] += 1
-        cat_ctr[md.get("category")] += 1
-        year_types[type(md.get("year")).__name__] += 1
+    print(f"\n--- 📊 DISTRIBUTIONS (from {sampled} sampled docs) ---")
 
-    def _print_top(name: str, ctr: Counter, topn: int = 10) -> None:
+    def _print_top(name: str, values: List[str], topn: int = 10) -> None:
         print(f"\n{name}:")
-        for k, v in ctr.most_common(topn):
-            print(f"  {k!r}: {v}")
+        for k, v in _distribution(values, topn):
+            print(f"  {k}: {v}")
 
-    _print_top("By regulator", reg_ctr)
-    _print_top("By type (artifact)", type_ctr)
-    _print_top("By category (semantic)", cat_ctr)
-    _print_top("Year value types", year_types)
+    _print_top("By regulator", columns["regulator"])
+    _print_top("By type (artifact)", columns["type"])
+    _print_top("By category (semantic)", columns["category"])
+    _print_top("Year value types", columns["year_type"])
 
     print("\n--- 🔗 SAMPLE IDS/URLS ---")
-    for i in range(min(8, len(metadatas))):
-        md = metadatas[i] or {}
+    for doc_id, md in head:
         print(
-            f"- id={ids[i] if i < len(ids) else 'N/A'}"
+            f"- id={doc_id}"
             f" | regulator={md.get('regulator')}"
             f" | category={md.get('category')}"
             f" | type={md.get('type')}"
@@ -229,7 +383,7 @@ def diagnose(
 def main() -> None:
     p = argparse.ArgumentParser()
     p.add_argument(
-        "--limit", type=int, default=25, help="How many docs to sample (max 500)."
+        "--limit", type=int, default=25, help="How many docs to sample (paged)."
     )
     p.add_argument(
         "--regulator",
@@ -254,16 +408,33 @@ def main() -> None:
         "--year",
         type=str,
         default=None,
-        help='Filter by year (e.g., "2026"). Matches int or str stored values.',
+        help='Filter by year (e.g., "2026"). Matches int stored values.',
+    )
+    p.add_argument(
+        "--count-only",
+        action="store_true",
+        help="Only report whether any document matches the filter (ids-only probe).",
+    )
+    p.add_argument(
+        "--migrate-year-ints",
+        action="store_true",
+        help="Convert digit-only string years to int in place, then exit.",
     )
     args = p.parse_args()
 
-    diagnose(
-        limit=args.limit,
-        regulator=args.regulator,
-        category=args.category,
-        type_=args.type_,
-        year=args.year,
+    if args.migrate_year_ints:
+        migrate_year_ints()
+        return
+
+    asyncio.run(
+        diagnose(
+            limit=args.limit,
+            regulator=args.regulator,
+            category=args.category,
+            type_=args.type_,
+            year=args.year,
+            count_only=args.count_only,
+        )
     )
 
 
@@ -4,23 +4,30 @@ Quick script to evaluate a single query using your agent.
 """
 
 import asyncio
-import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Add project root to path
-BASE_DIR = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(BASE_DIR))
-
 from dotenv import load_dotenv
 
-load_dotenv(BASE_DIR / ".env")
+# Project root (for .env); packages resolve via `pip install -e .` or `python -m`
+BASE_DIR = Path(__file__).resolve().parent.parent
+
 
-from evaluation.evaluator import AgentEvaluator
-from graph.builder import app as graph_app
+@lru_cache(maxsize=1)
+def _init_env() -> None:
+    """Load .env once, on first run (importing this module stays side-effect free)."""
+    load_dotenv(BASE_DIR / ".env")
 
 
 async def main():
-    evaluator = AgentEvaluator()
+    _init_env()
+
+    # Deferred: compiling the graph / building the judge only happens when run
+    from evaluation.runtime import get_evaluator
+    from graph.runtime import get_graph_app
+
+    graph_app = get_graph_app()
+    evaluator = get_evaluator()
 
     query = "What did the FOMC say about interest rates in 2023?"
 
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Render the LangGraph workflow diagram to langgraph.png.
+
+One parameterized script for all diagram variants:
+  --frontmatter-config  apply the mermaid frontmatter config (linear curves, base theme)
+  --max-width N         have mermaid.ink render the PNG at N pixels wide
+
+The mermaid source of the compiled graph (plus render options) is hashed and the
+signature is stored next to the image (langgraph.png.sig). When nothing changed,
+the render (mermaid.ink round-trip) is skipped entirely.
+
+The graph is imported inside main(), so --help never pays the compile cost.
+
+Usage:
+  python3.11 -m scripts.generate_langgraph_png
+  python3.11 -m scripts.generate_langgraph_png --frontmatter-config --max-width 900
+  python3.11 -m scripts.generate_langgraph_png --output docs/langgraph-workflow.png
+  python3.11 -m scripts.generate_langgraph_png --force
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Project root (output paths); packages resolve via `pip install -e .` or `python -m`
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_OUTPUT = BASE_DIR / "langgraph.png"
+MERMAID_INK_URL = "https://mermaid.ink/img/{encoded}"
+RENDER_TIMEOUT = 30
+
+FRONTMATTER_CONFIG: Dict[str, Any] = {
+    "config": {
+        "theme": "base",
+        "flowchart": {"curve": "linear"},
+    }
+}
+
+
+def _signature(mermaid_src: str, options: Dict[str, Any]) -> str:
+    payload = mermaid_src + "\n" + json.dumps(options, sort_keys=True)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _sig_path(output: Path) -> Path:
+    return output.with_name(output.name + ".sig")
+
+
+def _render_png(mermaid_src: str, width: Optional[int] = None) -> bytes:
+    """
+    Render via mermaid.ink in a single request. The width hint makes the
+    service produce the final size directly (no local decode/resize/re-encode).
+    """
+    import requests
+
+    encoded = base64.urlsafe_b64encode(mermaid_src.encode("utf-8")).decode("ascii")
+    params: Dict[str, Any] = {"type": "png", "bgColor": "!white"}
+    if width:
+        params["width"] = width
+
+    resp = requests.get(
+        MERMAID_INK_URL.format(encoded=encoded), params=params, timeout=RENDER_TIMEOUT
+    )
+    resp.raise_for_status()
+    return resp.content
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Render the LangGraph workflow PNG.")
+    p.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    p.add_argument(
+        "--frontmatter-config",
+        action="store_true",
+        help="Apply the mermaid frontmatter config (linear curves, base theme).",
+    )
+    p.add_argument(
+        "--max-width",
+        type=int,
+        default=None,
+        help="Render the PNG at this width in pixels.",
+    )
+    p.add_argument("--force", action="store_true", help="Re-render even if up-to-date.")
+    args = p.parse_args()
+
+    from graph.builder import app
+
+    output: Path = args.output
+    sig_file = _sig_path(output)
+    frontmatter: Optional[Dict[str, Any]] = (
+        FRONTMATTER_CONFIG if args.frontmatter_config else None
+    )
+
+    g = app.get_graph()
+    mermaid_src = g.draw_mermaid(frontmatter_config=frontmatter)
+    sig = _signature(mermaid_src, {"max_width": args.max_width})
+
+    if (
+        not args.force
+        and output.exists()
+        and sig_file.exists()
+        and sig_file.read_text(encoding="utf-8").strip() == sig
+    ):
+        print(f"✅ {output.name} up-to-date (sig {sig})")
+        return 0
+
+    print(f"🎨 Rendering {output} ...")
+    output.write_bytes(_render_png(mermaid_src, args.max_width))
+    sig_file.write_text(sig + "\n", encoding="utf-8")
+    print(f"✅ Wrote {output} (sig {sig})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,22 +4,29 @@ Interactive Chat Interface for Financial Regulation Agent
 """
 
 import asyncio
-import sys
 import uuid
-from pathlib import Path
 
-# Add project root to path
-BASE_DIR = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(BASE_DIR))
+from graph.runtime import get_embedder, get_graph_app
+from observability.logger import log_error, log_info, log_warning
+from retrieval.query_cache import QueryCache
 
-from graph.builder import app as graph_app
-from observability.logger import log_error, log_info
+graph_app = get_graph_app()
+
+
+async def _embed_query(query: str):
+    """Embed with the shared (file-cached) embedder singleton."""
+    try:
+        return await get_embedder().aembed_query(query)
+    except Exception as e:
+        log_warning(f"Query cache disabled for this turn (embedding failed): {e}")
+        return None
 
 
 async def chat():
     """Interactive chat loop with the agent."""
     session_id = str(uuid.uuid4())
     config = {"configurable": {"thread_id": session_id}}
+    cache = QueryCache()
 
     print("\n" + "=" * 70)
     print("💬 Financial Regulation Agent - Interactive Chat")
@@ -29,7 +36,8 @@ async def chat():
 
     while True:
         try:
-            query = input("You: ").strip()
+            # Read on a worker thread so background tasks keep running while typing
+            query = (await asyncio.to_thread(input, "You: ")).strip()
 
             if query.lower() in ["exit", "quit", "q"]:
                 print("👋 Goodbye!")
@@ -38,6 +46,13 @@ async def chat():
             if not query:
                 continue
 
+            query_emb = await _embed_query(query)
+            cached = cache.get(query_emb) if query_emb is not None else None
+            if cached is not None:
+                log_info(f"Query cache hit | stats={cache.stats}")
+                print(f"Agent (cached): {cached.response}\n")
+                continue
+
             print("🤖 Agent thinking...\n")
             log_info(f"Processing query: {query[:50]}...")
 
@@ -46,6 +61,8 @@ async def chat():
             response = result.get("synthesized_response") or result.get("generation")
 
             if response:
+                if query_emb is not None:
+                    cache.put(query_emb, response, result.get("retrieved_docs"))
                 print(f"Agent: {response}\n")
             else:
                 print(
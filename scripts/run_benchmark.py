@@ -4,28 +4,39 @@ Run full benchmark evaluation on multiple questions.
 """
 
 import asyncio
-import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Add project root to path
-BASE_DIR = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(BASE_DIR))
-
 from dotenv import load_dotenv
 
-load_dotenv(BASE_DIR / ".env")
+# Project root (for .env); packages resolve via `pip install -e .` or `python -m`
+BASE_DIR = Path(__file__).resolve().parent.parent
+
 
-from evaluation.evaluator import AgentEvaluator
-from graph.builder import app as graph_app
+@lru_cache(maxsize=1)
+def _init_env() -> None:
+    """Load .env once, on first run (importing this module stays side-effect free)."""
+    load_dotenv(BASE_DIR / ".env")
 
 
 async def main():
-    evaluator = AgentEvaluator()
+    _init_env()
+
+    # Deferred: compiling the graph / building the judge only happens when run
+    from evaluation.runtime import get_evaluator, warmup_evaluator
+    from graph.runtime import get_graph_app, warmup_embedder
+
+    graph_app = get_graph_app()
+    evaluator = get_evaluator()
 
     print("\n🚀 Starting benchmark evaluation...")
     print(f"Target Agent: LangGraph Regulatory Assistant (v2026)")
     print("-" * 50)
 
+    # Load the embedding model and judge before the timed benchmark region
+    await warmup_embedder()
+    await warmup_evaluator()
+
     results = await evaluator.run_benchmark(agent_app=graph_app, limit=20)
 
     print("\n" + "=" * 70)
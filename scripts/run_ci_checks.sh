@@ -49,9 +49,9 @@ run_test() {
   echo "══════════════════════════════════════════════════════════"
   echo "  TEST"
   echo "══════════════════════════════════════════════════════════"
-  $PIP install -q pytest pytest-cov pytest-asyncio pytest-mock 2>/dev/null || true
+  $PIP install -q pytest pytest-cov pytest-asyncio pytest-mock pytest-xdist 2>/dev/null || true
   export PYTHONPATH=.
-  $PYTEST tests/ -m "not integration" \
+  $PYTEST tests/ -m "not integration" -n auto --dist loadgroup \
     --cov=graph --cov=retrieval --cov=evaluation --cov=tools --cov=app \
     --cov-report=term-missing \
     -q
@@ -0,0 +1,68 @@
+# tests/_fixtures.py
+"""
+Module-level test data shared across test files.
+
+Built once at import instead of per test; treat as read-only.
+"""
+
+from langchain_core.documents import Document
+
+from evaluation.evaluator import BenchmarkQ
+
+# Full graph entry state (same shape as the controller's template); copy it and
+# set "query" rather than invoking the graph with the query alone
+_INITIAL_STATE = {
+    "query": "",
+    "intent": "other",
+    "plan": [],
+    "filters": {},
+    "retrieved_docs": [],
+    "tool_outputs": [],
+    "synthesized_response": "",
+    "validation_result": False,
+    "iterations": 0,
+    "final_output": "",
+}
+
+_SAMPLE_DOCS = (
+    Document(
+        page_content="The Federal Reserve raised the federal funds rate by 25 basis points."
+    ),
+    Document(page_content="Inflation has moderated but remains above the 2% target."),
+)
+
+_SAMPLE_RESULTS = (
+    {
+        "evaluation": {
+            "hallucination_score": 0.1,
+            "answer_quality": {"score": 0.85},
+            "retrieval_metrics": {"ndcg": 0.92},
+            "validation_result": True,
+        }
+    },
+    {
+        "evaluation": {
+            "hallucination_score": 0.6,
+            "answer_quality": {"score": 0.45},
+            "retrieval_metrics": {"ndcg": 0.65},
+            "validation_result": False,
+        }
+    },
+)
+
+# In-memory benchmark for AgentEvaluator(benchmark_data=...): no file I/O
+_BENCHMARK_QUESTIONS = (
+    BenchmarkQ(
+        query="What is the current Fed Funds Rate?",
+        ground_truth="The Fed Funds Rate target range is 5.25%-5.50%.",
+    ),
+    BenchmarkQ(
+        query="What is the minimum Tier 1 leverage ratio under Basel III?",
+        ground_truth="Basel III sets a 3% minimum Tier 1 leverage ratio.",
+        intent="calculation",
+    ),
+    BenchmarkQ(
+        query="Summarize the latest FOMC statement on inflation.",
+        ground_truth="Inflation has moderated but remains above the 2% target.",
+    ),
+)
@@ -0,0 +1,166 @@
+# tests/conftest.py
+"""
+Shared test fixtures.
+
+- All async tests share one session-scoped event loop (no per-test loop setup/teardown)
+- mock_extract_filters_llm builds the mocked extract_filters LLM used across files
+- integration_results runs every end-to-end agent query once per session,
+  concurrently, so LLM / retrieval latency overlaps instead of adding up
+  test by test.
+"""
+
+import asyncio
+import json
+import sys
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+# name -> (query, route the mocked extract_filters LLM returns)
+INTEGRATION_QUERIES = {
+    "regulatory_lookup": (
+        "What did the FOMC say about interest rates in their June 2023 meeting?",
+        "rag",
+    ),
+    "calculation_intent": (
+        "Calculate the impact of a 25 basis point rate hike on bank capital ratios",
+        "calculation",
+    ),
+    "structured_intent": (
+        "Extract the key dates and decisions from the latest FOMC minutes",
+        "structured",
+    ),
+    "graph_regulatory_lookup": (
+        "Summarize the latest FOMC statement on inflation.",
+        "rag",
+    ),
+    "graph_calculation": (
+        "What is the current Fed Funds Rate and how does it compare to last year?",
+        "calculation",
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    return asyncio.DefaultEventLoopPolicy()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow", action="store_true", help="run @pytest.mark.slow timing tests"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Run every async test in the session-scoped event loop, and pin integration
+    tests to one xdist worker (--dist loadgroup) so the session-scoped
+    integration_results fixture and its LLM patch run once, not per worker.
+    Wall-clock (slow) tests are skipped unless --run-slow is given.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    llm_group = pytest.mark.xdist_group("llm")
+    skip_slow = pytest.mark.skip(reason="wall-clock test: pass --run-slow")
+    run_slow = config.getoption("--run-slow")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if item.get_closest_marker("integration"):
+            item.add_marker(llm_group)
+        if not run_slow and item.get_closest_marker("slow"):
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(autouse=True)
+def _clear_filter_cache():
+    """Tests mock different routes for similar queries: never reuse cached filters."""
+    module = sys.modules.get("graph.nodes.extract_filters")  # only if loaded
+    if module is not None:
+        module.clear_filter_cache()
+    builder = sys.modules.get("graph.builder")  # LangGraph node-output cache
+    if builder is not None:
+        builder.node_cache.clear()
+    yield
+
+
+def _extract_filters_llm(
+    route_for: Callable[[str], str],
+    regulators: Optional[List[str]] = None,
+    calls: Optional[List[str]] = None,
+):
+    """
+    Mock extract_filters LLM returning JSON with route_for(query) as the route.
+    Batched calls (a JSON array of queries) get a JSON array back. If `calls`
+    is given, each LLM round-trip appends its human message to it.
+    """
+    from langchain_core.runnables import RunnableLambda
+
+    def _payload(query: str) -> Dict[str, Any]:
+        return {
+            "regulators": regulators or ["FED"],
+            "categories": None,
+            "types": None,
+            "year": None,
+            "jurisdiction": "US",
+            "sort": None,
+            "route": route_for(query),
+        }
+
+    async def _fake_ainvoke(x):
+        human = x.to_messages()[-1].content
+        if calls is not None:
+            calls.append(human)
+        if human.lstrip().startswith("["):
+            payload = [_payload(q) for q in json.loads(human)]
+        else:
+            payload = _payload(human)
+        return SimpleNamespace(content=json.dumps(payload))
+
+    return RunnableLambda(_fake_ainvoke)
+
+
+@lru_cache(maxsize=None)
+def _static_route_llm(route: str, regulators: Optional[Tuple[str, ...]]):
+    """Stateless (no call recording) mocks are shared per (route, regulators)."""
+    return _extract_filters_llm(
+        lambda _query: route, list(regulators) if regulators else None
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_extract_filters_llm():
+    """Factory: make(route, regulators=None, calls=None) -> mocked extract_filters LLM."""
+
+    def make(route: str, regulators=None, calls=None):
+        if calls is None:
+            return _static_route_llm(route, tuple(regulators) if regulators else None)
+        return _extract_filters_llm(lambda _query: route, regulators, calls)
+
+    return make
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def integration_results() -> Dict[str, Dict[str, Any]]:
+    """Fire all integration queries concurrently once; results keyed by name."""
+    from graph.builder import app
+    from tests._fixtures import _INITIAL_STATE
+
+    routes = {query: route for query, route in INTEGRATION_QUERIES.values()}
+
+    with patch(
+        "graph.nodes.extract_filters.get_llm",
+        return_value=_extract_filters_llm(lambda q: routes.get(q, "rag")),
+    ):
+        results = await asyncio.gather(
+            *(
+                app.ainvoke({**_INITIAL_STATE, "query": q})
+                for q, _ in INTEGRATION_QUERIES.values()
+            )
+        )
+
+    return dict(zip(INTEGRATION_QUERIES, results))
@@ -29,29 +29,21 @@ requires_llm = pytest.mark.skipif(
     not _has_llm_api_key(),
     reason="LLM API key required (GOOGLE_API_KEY or OPENAI_API_KEY)",
 )
-from langchain_core.documents import Document
-
 from evaluation.answer_eval import evaluate_answer_quality
 from evaluation.evaluator import AgentEvaluator
 from evaluation.hallucination_detector import detect_hallucinations
 from evaluation.metrics import calculate_metrics
+from tests._fixtures import _BENCHMARK_QUESTIONS, _SAMPLE_DOCS, _SAMPLE_RESULTS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_documents():
-    return [
-        Document(
-            page_content="The Federal Reserve raised the federal funds rate by 25 basis points."
-        ),
-        Document(
-            page_content="Inflation has moderated but remains above the 2% target."
-        ),
-    ]
+    return _SAMPLE_DOCS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_evaluator():
-    evaluator = AgentEvaluator(benchmark_path="evaluation/benchmark_questions.json")
+    evaluator = AgentEvaluator(benchmark_data=_BENCHMARK_QUESTIONS)
     return evaluator
 
 
@@ -93,26 +85,7 @@ async def test_answer_quality_evaluation():
 
 def test_metrics_calculation():
     """Test aggregate metrics calculation"""
-    sample_results = [
-        {
-            "evaluation": {
-                "hallucination_score": 0.1,
-                "answer_quality": {"score": 0.85},
-                "retrieval_metrics": {"ndcg": 0.92},
-                "validation_result": True,
-            }
-        },
-        {
-            "evaluation": {
-                "hallucination_score": 0.6,
-                "answer_quality": {"score": 0.45},
-                "retrieval_metrics": {"ndcg": 0.65},
-                "validation_result": False,
-            }
-        },
-    ]
-
-    metrics = calculate_metrics(sample_results)
+    metrics = calculate_metrics(list(_SAMPLE_RESULTS))
 
     assert "overall_score" in metrics
     assert 0.0 <= metrics["overall_score"] <= 1.0
@@ -120,6 +93,25 @@ def test_metrics_calculation():
     assert "validation_pass_rate" in metrics
 
 
+def test_benchmark_load_is_cached():
+    """Evaluators for the same unchanged benchmark file share one parsed copy"""
+    first = AgentEvaluator(benchmark_path="evaluation/benchmark_questions.json")
+    other = AgentEvaluator(benchmark_path="evaluation/benchmark_questions.json")
+
+    assert other.benchmark_data is first.benchmark_data
+    assert first.benchmark_data and all(q.query for q in first.benchmark_data)
+
+
+def test_benchmark_data_skips_file(sample_evaluator):
+    """In-memory benchmark_data is used as-is; the benchmark file is not read"""
+    with patch("evaluation.evaluator._load_benchmark_cached") as load:
+        evaluator = AgentEvaluator(benchmark_data=_BENCHMARK_QUESTIONS)
+
+    load.assert_not_called()
+    assert evaluator.benchmark_data == _BENCHMARK_QUESTIONS
+    assert len(sample_evaluator.benchmark_data) == 3
+
+
 @requires_llm
 @pytest.mark.asyncio
 async def test_evaluator_single_query(sample_evaluator, sample_documents):
@@ -150,5 +142,6 @@ async def test_benchmark_run(sample_evaluator, sample_documents):
     result = await sample_evaluator.run_benchmark(mock_agent, limit=3)
 
     assert "overall_metrics" in result
+    assert "node_latency_ms" in result
     assert "detailed_results" in result
     assert len(result["detailed_results"]) <= 3
@@ -10,13 +10,22 @@ Tests cover:
 """
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple
+from unittest.mock import patch
 
 import pytest
 from langchain_core.documents import Document
 
-from retrieval.hybrid_search import hybrid_search
-from retrieval.vector_store import add_documents, get_vector_store
+from retrieval.hybrid_search import (
+    _build_where,
+    _build_where_cached,
+    _build_where_uncached,
+    hybrid_search,
+)
+from retrieval.query_cache import QueryCache
+from retrieval.vector_store import add_documents as vs_add_documents
+from retrieval.vector_store import get_vector_store
 
 
 @pytest.fixture
@@ -37,22 +46,65 @@ def sample_documents():
     ]
 
 
+@dataclass
+class StubRetriever:
+    docs: List[Document]
+
+    async def ainvoke(self, *args, **kwargs) -> List[Document]:
+        return self.docs
+
+
+class _StubCollection(NamedTuple):
+    store: "StubStore"
+
+    def count(self) -> int:
+        return len(self.store.docs)
+
+    def query(self, query_embeddings, n_results, **kwargs) -> Dict[str, list]:
+        self.store.batched_queries.append(len(query_embeddings))
+        docs = self.store.docs[:n_results]
+        return {
+            "documents": [[d.page_content for d in docs] for _ in query_embeddings],
+            "metadatas": [[d.metadata for d in docs] for _ in query_embeddings],
+        }
+
+
+class _StubEmbeddings:
+    async def aembed_query(self, text: str) -> List[float]:
+        return [1.0, 0.0]
+
+
+@dataclass
+class StubStore:
+    """Plain stand-in for the Chroma store (only the methods retrieval uses)."""
+
+    docs: List[Document] = field(default_factory=list)
+    embeddings: _StubEmbeddings = field(default_factory=_StubEmbeddings)
+    batched_queries: List[int] = field(default_factory=list)
+
+    @property
+    def _collection(self) -> _StubCollection:
+        return _StubCollection(self)
+
+    def as_retriever(self, **kwargs) -> StubRetriever:
+        return StubRetriever(self.docs)
+
+    def get(self, *args, **kwargs) -> Dict[str, list]:
+        return {
+            "documents": [d.page_content for d in self.docs],
+            "metadatas": [d.metadata for d in self.docs],
+        }
+
+    def delete_collection(self) -> None:
+        return None
+
+    def add_documents(self, *args, **kwargs) -> None:
+        return None
+
+
 def _make_mock_store(docs=None):
-    """Create a mock vector store for tests (avoids Chroma/embedding in CI)."""
-    docs = docs or []
-    mock_retriever = AsyncMock()
-    mock_retriever.ainvoke.return_value = docs
-
-    mock_store = MagicMock()
-    mock_store.as_retriever.return_value = mock_retriever
-    mock_store.get.return_value = {
-        "documents": [d.page_content for d in docs],
-        "metadatas": [d.metadata for d in docs],
-    }
-    mock_store._collection.count.return_value = len(docs)
-    mock_store.delete_collection.return_value = None
-    mock_store.add_documents.return_value = None
-    return mock_store
+    """Create a stub vector store for tests (avoids Chroma/embedding in CI)."""
+    return StubStore(list(docs or []))
 
 
 @pytest.mark.asyncio
@@ -134,6 +186,151 @@ async def test_hybrid_search_with_reranker_disabled(mock_hs_store, mock_vs_store
     assert len(results) <= 5
 
 
+@pytest.mark.asyncio
+@patch("retrieval.hybrid_search.get_vector_store")
+async def test_concurrent_hybrid_searches_share_one_vector_query(
+    mock_hs_store, sample_documents
+):
+    """
+    Concurrent searches with the same k/filters: the first goes out at once,
+    the rest queue behind it and share a single Chroma query
+    """
+    mock_store = _make_mock_store(sample_documents)
+    mock_hs_store.return_value = mock_store
+
+    results = await asyncio.gather(
+        *(hybrid_search(f"FOMC rates question {i}", k=2) for i in range(5))
+    )
+
+    assert mock_store.batched_queries == [4]
+    assert all(0 < len(docs) <= 2 for docs in results)
+
+
+class _PublicApiStore(StubStore):
+    """A store without a Chroma collection: only the public search API."""
+
+    _collection = None
+
+    def similarity_search_by_vector(self, embedding, k, filter=None):
+        self.batched_queries.append(1)
+        return self.docs[:k]
+
+
+@pytest.mark.asyncio
+async def test_batched_vector_search_falls_back_to_public_api(sample_documents):
+    """Stores without a Chroma collection are searched per vector, in order"""
+    from retrieval.batch_search import _search_many
+
+    store = _PublicApiStore(list(sample_documents))
+
+    results = await _search_many(store, ["q1", "q2", "q3"], 2, {"source": "fomc"})
+
+    assert store.batched_queries == [1, 1, 1]
+    assert results == [sample_documents[:2]] * 3
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_batched_vector_search_matches_similarity_search(sample_documents):
+    """One batched Chroma query returns what per-query similarity_search would"""
+    from langchain_chroma import Chroma
+    from langchain_core.embeddings.fake import DeterministicFakeEmbedding
+
+    from retrieval.batch_search import _search_many
+
+    store = Chroma(
+        collection_name="batch_search_parity",
+        embedding_function=DeterministicFakeEmbedding(size=16),
+    )
+    store.add_documents(sample_documents[:2])
+    queries = ["FOMC interest rates", "inflation target", "climate disclosure"]
+    where = {"source": "fomc"}
+
+    try:
+        batched = await _search_many(store, queries, 2, where)
+        expected = [store.similarity_search(q, k=2, filter=where) for q in queries]
+    finally:
+        store.delete_collection()
+
+    assert [[(d.id, d.page_content, d.metadata) for d in docs] for docs in batched] == [
+        [(d.id, d.page_content, d.metadata) for d in docs] for docs in expected
+    ]
+
+
+def test_build_where_is_cached_and_returns_fresh_dict():
+    """Repeated filter shapes hit the where-cache without sharing a mutable dict"""
+    filters = {"regulators": ["FED"], "year": 2024, "jurisdiction": "US"}
+    _build_where_cached.cache_clear()
+
+    first = _build_where(filters)
+    second = _build_where(filters)
+
+    assert first == second
+    assert first is not second
+    assert isinstance(first, dict)
+    assert _build_where_cached.cache_info().hits == 1
+
+    # Nested $and / $in lists are copies too: mutating them can't leak into the cache
+    first["$and"].clear()
+    second["$and"][0]["regulator"]["$in"].append("SEC")
+    assert _build_where(filters) == _build_where_uncached(filters)
+    assert _build_where({}) is None
+
+
+def test_query_cache_similarity_hit_and_lru_eviction():
+    """Near-duplicate embeddings hit the cache; overflow evicts the oldest entry"""
+    cache = QueryCache(max_size=2, ttl_seconds=60, threshold=0.95)
+    cache.put([1.0, 0.0, 0.0], "rates answer")
+    cache.put([0.0, 1.0, 0.0], "capital answer")
+
+    hit = cache.get([0.99, 0.01, 0.0])
+    assert hit is not None and hit.response == "rates answer"
+
+    cache.put([0.0, 0.0, 1.0], "basel answer")  # evicts LRU ("capital answer")
+    assert cache.get([0.0, 1.0, 0.0]) is None
+    assert cache.stats["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_query_cache_ttl_expiry():
+    """Expired entries are treated as misses"""
+    cache = QueryCache(max_size=4, ttl_seconds=-1)
+    cache.put([1.0, 0.0], "stale")
+
+    assert cache.get([1.0, 0.0]) is None
+    assert cache.stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_vector_store_prefetch_opens_once_in_background():
+    """Graph-entry prefetch opens the store once, off the event loop"""
+    import retrieval.vector_store as vs
+
+    opened = []
+
+    def _fake_open():
+        opened.append(True)
+        return StubStore()
+
+    with (
+        patch.object(vs, "get_vector_store", side_effect=_fake_open),
+        patch.object(vs, "VECTOR_STORE_PREFETCH", True),
+        patch.object(vs, "_vector_store", None),
+        patch.object(vs, "_prefetch", None),
+    ):
+        vs.prefetch_vector_store()
+        vs.prefetch_vector_store()  # already in flight: no second open
+        await vs.await_prefetch()
+        assert opened == [True]
+
+        # Finished prefetches are cleared, so a reset store is prefetched again
+        assert vs._prefetch is None
+        vs.prefetch_vector_store()
+        await vs.await_prefetch()
+
+    assert opened == [True, True]
+
+
 @pytest.mark.integration
 def test_vector_store_integration():
     """Test direct integration with vector store (requires Chroma DB)"""
@@ -10,22 +10,67 @@ Tests cover:
 """
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+import pytest_asyncio
 
+import tools.treasury as treasury
 from tools.fed_balance_sheet import FedBalanceSheetTool
 from tools.market_data import MarketDataTool
 from tools.registry import ToolRegistry
 from tools.treasury import TreasuryTool
 
+_TREASURY_RECORD = {"record_date": "2025-01-31", "avg_interest_rate_amt": "4.25"}
+
 
 @pytest.fixture
 def clean_registry():
-    """Reset registry before each test"""
-    ToolRegistry._tools = {}
+    """Empty registry (no lazy built-ins) for each test; restored afterwards"""
+    saved = ToolRegistry._tools, ToolRegistry._factories
+    ToolRegistry._tools, ToolRegistry._factories = {}, {}
     yield
-    ToolRegistry._tools = {}
+    ToolRegistry._tools, ToolRegistry._factories = saved
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def treasury_api():
+    """
+    Serve the Fiscal Data API from an in-process transport. Yields the request
+    log plus the list of clients the tool created; closes them afterwards.
+    """
+    requests, clients = [], []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"data": [_TREASURY_RECORD]})
+
+    def make_client() -> httpx.AsyncClient:
+        clients.append(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        return clients[-1]
+
+    await treasury.aclose_client()
+    with patch.object(treasury, "_make_client", make_client):
+        yield SimpleNamespace(requests=requests, clients=clients)
+    await treasury.aclose_client()
+
+
+def test_builtin_tools_resolve_lazily():
+    """Built-in tools are listed up front but only instantiated on first use"""
+    saved = dict(ToolRegistry._tools)
+    ToolRegistry._tools.pop("market_data", None)
+    try:
+        assert "market_data" in ToolRegistry.list_tools()
+        assert "market_data" not in ToolRegistry._tools
+
+        tool = ToolRegistry.get_tool("market_data")
+
+        assert isinstance(tool, MarketDataTool)
+        assert ToolRegistry.get_tool("market_data") is tool
+    finally:
+        ToolRegistry._tools = saved
 
 
 def test_tool_registration(clean_registry):
@@ -55,14 +100,35 @@ def test_get_nonexistent_tool(clean_registry):
 
 
 @pytest.mark.asyncio
-async def test_treasury_tool_execution(clean_registry):
-    """Test actual tool execution (TreasuryTool is placeholder, returns static data)"""
+async def test_treasury_tool_execution(clean_registry, treasury_api):
+    """Test actual tool execution against the (mocked) Fiscal Data API"""
     ToolRegistry.register(TreasuryTool)
 
     result = await ToolRegistry.invoke("treasury", endpoint="avg_interest_rates")
 
-    assert result is not None
-    assert "data" in result or "status" in result
+    assert result == {"status": "success", "data": [_TREASURY_RECORD]}
+    assert treasury_api.requests[0].url.path.endswith("/avg_interest_rates")
+
+
+@pytest.mark.asyncio
+async def test_treasury_tool_reuses_pooled_client(treasury_api):
+    """Every call on a loop goes through one pooled client (no per-call handshake)"""
+    tool = TreasuryTool()
+
+    await asyncio.gather(tool.aexecute(), tool.aexecute())
+    await tool.aexecute()
+
+    assert len(treasury_api.requests) == 3
+    assert len(treasury_api.clients) == 1
+
+
+@pytest.mark.asyncio
+async def test_treasury_tool_rejects_unknown_endpoint(treasury_api):
+    """Caller-supplied endpoints outside the whitelist never reach the network"""
+    with pytest.raises(ValueError, match="Unsupported Treasury endpoint"):
+        await TreasuryTool().aexecute(endpoint="../../v1/secret")
+
+    assert treasury_api.requests == []
 
 
 @pytest.mark.asyncio
@@ -94,7 +160,7 @@ def test_list_tools(clean_registry):
 
 
 @pytest.mark.asyncio
-async def test_call_tools_node_integration(clean_registry):
+async def test_call_tools_node_integration(clean_registry, treasury_api):
     """Test integration with call_tools node in graph"""
     ToolRegistry.register(TreasuryTool)
 
@@ -106,4 +172,4 @@ async def test_call_tools_node_integration(clean_registry):
     result = await call_tools(state)
 
     assert "tool_outputs" in result
-    assert len(result["tool_outputs"]) >= 0
+    assert all(o["kind"] == "treasury" for o in result["tool_outputs"])
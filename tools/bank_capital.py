@@ -6,9 +6,26 @@ Placeholder tool for retrieving bank capital ratios and regulatory capital data.
 Replace this with real API calls when you have a data source.
 """
 
-from observability.logger import log_error, log_info
+from observability.logger import log_info
 
-from .base import BaseTool
+from .base import TOOL_VERBOSE, BaseTool, LogSampler
+
+# Constant placeholder payload, built once at import (empty unless TOOL_VERBOSE)
+_DATA = (
+    {
+        "cet1_ratio": "13.5%",
+        "tier1_ratio": "15.2%",
+        "total_capital_ratio": "18.1%",
+        "note": "This is placeholder data. Connect to real source.",
+    }
+    if TOOL_VERBOSE
+    else {}
+)
+_RESPONSE = {"status": "success", "data": _DATA}
+if TOOL_VERBOSE:
+    _RESPONSE["message"] = "Bank capital data tool - placeholder response"
+
+_log_sample = LogSampler()
 
 
 class BankCapitalTool(BaseTool):
@@ -22,18 +39,7 @@ class BankCapitalTool(BaseTool):
         Placeholder implementation.
         Replace this with actual API/database call when ready.
         """
-        try:
+        if TOOL_VERBOSE and _log_sample():
             log_info("BankCapitalTool executed (placeholder)")
-            return {
-                "status": "success",
-                "message": "Bank capital data tool - placeholder response",
-                "data": {
-                    "cet1_ratio": "13.5%",
-                    "tier1_ratio": "15.2%",
-                    "total_capital_ratio": "18.1%",
-                    "note": "This is placeholder data. Connect to real source.",
-                },
-            }
-        except Exception as e:
-            log_error("BankCapitalTool execution failed", error=str(e))
-            return {"status": "error", "message": str(e)}
+        # Copies so callers can mutate their result without touching the constant
+        return {**_RESPONSE, "data": dict(_DATA)}
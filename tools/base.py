@@ -5,9 +5,15 @@ Base Tool Class
 All tools must inherit from this abstract base class.
 """
 
+import itertools
+import os
 from abc import ABC, abstractmethod
 from typing import Any
 
+# Placeholder tools only return their sample data (and log) when TOOL_VERBOSE=1;
+# otherwise they answer with an empty payload and skip logging entirely.
+TOOL_VERBOSE = os.getenv("TOOL_VERBOSE") == "1"
+
 
 class BaseTool(ABC):
     """Abstract base class for all tools."""
@@ -22,3 +28,17 @@ class BaseTool(ABC):
 
     def __str__(self):
         return f"{self.name} - {self.description}"
+
+
+class LogSampler:
+    """
+    Every-Nth-call gate for hot-path logging (e.g. placeholder tools).
+    next() on itertools.count is atomic under the GIL, so no lock is needed.
+    """
+
+    def __init__(self, every: int = 100):
+        self._calls = itertools.count()
+        self._every = max(1, every)
+
+    def __call__(self) -> bool:
+        return next(self._calls) % self._every == 0
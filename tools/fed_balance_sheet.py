@@ -1,7 +1,14 @@
 # tools/fed_balance_sheet.py
 from observability.logger import log_info
 
-from .base import BaseTool
+from .base import TOOL_VERBOSE, BaseTool, LogSampler
+
+_RESPONSE = {
+    "status": "success",
+    "data": "Placeholder Fed Balance Sheet data" if TOOL_VERBOSE else "",
+}
+
+_log_sample = LogSampler()
 
 
 class FedBalanceSheetTool(BaseTool):
@@ -9,5 +16,6 @@ class FedBalanceSheetTool(BaseTool):
     description = "Retrieves Federal Reserve balance sheet data."
 
     async def aexecute(self, *args, **kwargs):
-        log_info("FedBalanceSheetTool executed (placeholder)")
-        return {"status": "success", "data": "Placeholder Fed Balance Sheet data"}
+        if TOOL_VERBOSE and _log_sample():
+            log_info("FedBalanceSheetTool executed (placeholder)")
+        return _RESPONSE.copy()  # flat dict: a shallow copy is a full copy
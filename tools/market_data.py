@@ -1,7 +1,14 @@
 # tools/market_data.py
 from observability.logger import log_info
 
-from .base import BaseTool
+from .base import TOOL_VERBOSE, BaseTool, LogSampler
+
+_RESPONSE = {
+    "status": "success",
+    "data": "Placeholder market data" if TOOL_VERBOSE else "",
+}
+
+_log_sample = LogSampler()
 
 
 class MarketDataTool(BaseTool):
@@ -9,5 +16,6 @@ class MarketDataTool(BaseTool):
     description = "Retrieves general market data."
 
     async def aexecute(self, *args, **kwargs):
-        log_info("MarketDataTool executed (placeholder)")
-        return {"status": "success", "data": "Placeholder market data"}
+        if TOOL_VERBOSE and _log_sample():
+            log_info("MarketDataTool executed (placeholder)")
+        return _RESPONSE.copy()  # flat dict: a shallow copy is a full copy
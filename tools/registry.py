@@ -2,97 +2,91 @@
 """
 Tool Registry
 
-Central registry for all tools. Supports graceful registration with error handling.
+Central registry for all tools, as plain module-level functions over the
+module-level _tools / _factories dicts. Built-in tools are registered lazily:
+only a (module, class) factory is recorded at import, and the tool module is
+imported and instantiated on first get_tool()/invoke(). Importing the registry
+therefore costs no tool imports or per-tool logging.
+
+`ToolRegistry` is an alias of this module, so existing
+`ToolRegistry.invoke(...)` / `ToolRegistry.register(...)` callers keep working.
 """
 
-from typing import Any, Dict, Type
+import importlib
+import sys
+from typing import Any, Dict, Tuple, Type
 
 from observability.logger import log_debug, log_error, log_info, log_warning
 
 from .base import BaseTool
 
-# Import tools with safe handling
-tools_to_register = []
-
-try:
-    from .bank_capital import BankCapitalTool
-
-    tools_to_register.append(BankCapitalTool)
-except ImportError:
-    log_warning("BankCapitalTool not found or file is empty. Skipping registration.")
-
-try:
-    from .treasury import TreasuryTool
-
-    tools_to_register.append(TreasuryTool)
-except ImportError:
-    log_warning("TreasuryTool not found. Skipping registration.")
-
-try:
-    from .fed_balance_sheet import FedBalanceSheetTool
-
-    tools_to_register.append(FedBalanceSheetTool)
-except ImportError:
-    log_warning("FedBalanceSheetTool not found. Skipping registration.")
-
-try:
-    from .market_data import MarketDataTool
-
-    tools_to_register.append(MarketDataTool)
-except ImportError:
-    log_warning("MarketDataTool not found. Skipping registration.")
-
-
-class ToolRegistry:
-    _instance = None
-    _tools: Dict[str, BaseTool] = {}
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    @classmethod
-    def register(cls, tool_class: Type[BaseTool]):
-        """Register a tool class safely."""
-        try:
-            tool = tool_class()
-            cls._tools[tool.name] = tool
-            log_info(f"Registered tool: {tool.name}")
-        except Exception as e:
-            log_error(f"Failed to register tool {tool_class.__name__}", error=str(e))
-
-    @classmethod
-    def get_tool(cls, name: str) -> BaseTool:
-        tool = cls._tools.get(name)
-        if not tool:
-            log_warning(f"Tool not found: {name}")
-            raise ValueError(f"Tool '{name}' not registered")
-        return tool
-
-    @classmethod
-    def list_tools(cls) -> list:
-        tools_list = list(cls._tools.keys())
-        log_debug(f"Listed tools: {tools_list}")
-        return tools_list
-
-    @classmethod
-    async def invoke(cls, name: str, *args, **kwargs) -> Any:
-        """Invoke a registered tool asynchronously."""
-        tool = cls.get_tool(name)
-        log_debug(f"Invoking tool: {name}")
-
-        try:
-            result = await tool.aexecute(*args, **kwargs)
-            log_info(f"Tool {name} executed successfully")
-            return result
-        except Exception as e:
-            log_error(f"Tool {name} execution failed", error=str(e))
-            raise
-
-
-# Auto-register available tools
-for tool_class in tools_to_register:
-    ToolRegistry.register(tool_class)
-
-log_info(f"ToolRegistry initialized with {len(ToolRegistry._tools)} tools")
+# Built-in tools: name -> (module, class), resolved on first use
+_BUILTIN_FACTORIES: Dict[str, Tuple[str, str]] = {
+    "bank_capital": ("tools.bank_capital", "BankCapitalTool"),
+    "treasury": ("tools.treasury", "TreasuryTool"),
+    "fed_balance_sheet": ("tools.fed_balance_sheet", "FedBalanceSheetTool"),
+    "market_data": ("tools.market_data", "MarketDataTool"),
+}
+
+_tools: Dict[str, BaseTool] = {}
+_factories: Dict[str, Tuple[str, str]] = dict(_BUILTIN_FACTORIES)
+
+
+def register(tool_class: Type[BaseTool]):
+    """Register (and instantiate) a tool class safely."""
+    try:
+        tool = tool_class()
+        _tools[tool.name] = tool
+        log_debug(f"Registered tool: {tool.name}")
+    except Exception as e:
+        log_error(f"Failed to register tool {tool_class.__name__}", error=str(e))
+
+
+def _materialize(name: str) -> BaseTool | None:
+    """Import + instantiate a lazily registered tool; cached in _tools."""
+    factory = _factories.get(name)
+    if factory is None:
+        return None
+
+    module_name, class_name = factory
+    try:
+        tool_class = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError):
+        log_warning(f"{class_name} not found. Skipping registration.")
+        _factories.pop(name, None)
+        return None
+
+    register(tool_class)
+    return _tools.get(name)
+
+
+def get_tool(name: str) -> BaseTool:
+    tool = _tools.get(name) or _materialize(name)
+    if not tool:
+        log_warning(f"Tool not found: {name}")
+        raise ValueError(f"Tool '{name}' not registered")
+    return tool
+
+
+def list_tools() -> list:
+    tools_list = list(dict.fromkeys([*_tools, *_factories]))
+    log_debug(f"Listed tools: {tools_list}")
+    return tools_list
+
+
+async def invoke(name: str, *args, **kwargs) -> Any:
+    """Invoke a registered tool asynchronously."""
+    tool = get_tool(name)
+    log_debug(f"Invoking tool: {name}")
+
+    try:
+        result = await tool.aexecute(*args, **kwargs)
+        log_info(f"Tool {name} executed successfully")
+        return result
+    except Exception as e:
+        log_error(f"Tool {name} execution failed", error=str(e))
+        raise
+
+
+# Backward-compatible namespace: ToolRegistry.<fn> resolves to the functions above
+ToolRegistry = sys.modules[__name__]
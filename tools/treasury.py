@@ -1,13 +1,85 @@
 # tools/treasury.py
+"""
+Treasury Tool
+
+Fetches U.S. Treasury rate data from the Fiscal Data API. Calls on the same
+event loop share one httpx.AsyncClient (connection pool + keep-alive), so
+repeated invocations reuse open TLS connections instead of handshaking per
+call. Clients are kept per loop because pooled connections are bound to the
+loop that opened them. The web server closes its client on shutdown via
+aclose_client().
+
+Only the datasets in ALLOWED_ENDPOINTS can be requested; the endpoint is
+caller-supplied and is interpolated into the URL.
+"""
+
+import asyncio
+import os
+import weakref
+
+import httpx
+
 from observability.logger import log_info
 
 from .base import BaseTool
 
+TREASURY_API_URL = os.getenv(
+    "TREASURY_API_URL",
+    "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v2/accounting/od",
+)
+DEFAULT_ENDPOINT = "avg_interest_rates"
+DEFAULT_PAGE_SIZE = 10
+
+# Fiscal Data datasets under TREASURY_API_URL that the tool may query
+ALLOWED_ENDPOINTS = frozenset({"avg_interest_rates", "debt_to_penny"})
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _make_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=10,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    )
+
+
+def _get_client() -> httpx.AsyncClient:
+    """The running loop's pooled client, created on first use (and after aclose)."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = _make_client()
+    return client
+
+
+async def aclose_client() -> None:
+    """Close the running loop's client (app shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class TreasuryTool(BaseTool):
     name = "treasury"
     description = "Retrieves Treasury yield data and interest rates."
 
-    async def aexecute(self, *args, **kwargs):
-        log_info("TreasuryTool executed (placeholder)")
-        return {"status": "success", "data": "Placeholder Treasury data"}
+    async def aexecute(
+        self,
+        *args,
+        endpoint: str = DEFAULT_ENDPOINT,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        **kwargs,
+    ):
+        if endpoint not in ALLOWED_ENDPOINTS:
+            raise ValueError(f"Unsupported Treasury endpoint: {endpoint!r}")
+
+        response = await _get_client().get(
+            f"{TREASURY_API_URL}/{endpoint}",
+            params={"sort": "-record_date", "page[size]": page_size},
+        )
+        response.raise_for_status()
+        data = response.json().get("data", [])
+        log_info(f"TreasuryTool fetched {len(data)} records from {endpoint}")
+        return {"status": "success", "data": data}
@@ -0,0 +1,21 @@
+# webapp/orjson_response.py
+"""
+ORJSONResponse - orjson-backed JSON response class for the web gateway.
+
+Used as the app's default_response_class. Non-string dict keys and NumPy
+values serialize natively; anything else orjson can't encode falls back to str().
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=_ORJSON_OPTIONS)
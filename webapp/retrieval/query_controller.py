@@ -8,6 +8,7 @@ Standardized for Python 3.11 and high-concurrency (300 RPM).
 import asyncio
 import os
 import traceback
+from functools import lru_cache
 from typing import Any, Dict
 
 from app.config import Config
@@ -15,6 +16,34 @@ from graph.builder import app as graph_app
 from graph.state import AgentState
 from observability.logger import log_error, log_info, log_warning
 
+# Bound once: the compiled graph never changes, so skip the attribute load per call
+_ainvoke = graph_app.ainvoke
+
+# Read once at import: error responses include a traceback only in DEBUG mode
+_DEBUG = os.getenv("DEBUG") == "true"
+
+# asyncio.timeout() is 3.11+; wait_for remains the 3.10 fallback
+_HAS_ASYNCIO_TIMEOUT = hasattr(asyncio, "timeout")
+
+# Graph entry state; ask() copies it and sets the query. The empty containers
+# are shared between copies, which is safe: reducer channels (retrieved_docs,
+# tool_outputs) build new lists, and nodes return fresh plan/filters values.
+_INITIAL_STATE_TEMPLATE: AgentState = {
+    "query": "",
+    "intent": "other",
+    "plan": [],
+    "filters": {},
+    "retrieved_docs": [],
+    "tool_outputs": [],
+    "synthesized_response": "",
+    "validation_result": False,
+    "iterations": 0,
+    "final_output": "",
+}
+
+# Answer fields in preference order (see RAGController._pick_final_answer)
+_ANSWER_KEYS = ("final_output", "synthesized_response", "response")
+
 RATE_LIMIT_INDICATORS = (
     "429",
     "resource_exhausted",
@@ -39,6 +68,18 @@ def _is_rate_limit_error(exc: BaseException) -> bool:
     return False
 
 
+MAX_QUERY_CHARS = 2000
+_QUERY_WS_SLACK = 10
+
+
+def _query_too_long(length: int) -> Dict[str, Any]:
+    log_warning("⚠️ [Controller] Query too long", chars=length)
+    return {
+        "error": f"Query is too long (maximum {MAX_QUERY_CHARS} characters)",
+        "success": False,
+    }
+
+
 class RAGController:
     """
     Singleton controller for invoking the Financial Regulation Agent graph.
@@ -58,10 +99,12 @@ class RAGController:
         Canonical answer selection.
         Prefer final_output (LangGraph terminal output), then synthesized_response, then response.
         """
-        for key in ("final_output", "synthesized_response", "response"):
+        for key in _ANSWER_KEYS:
             val = result.get(key)
-            if isinstance(val, str) and val.strip():
-                return val.strip()
+            if isinstance(val, str):
+                stripped = val.strip()  # one scan of a possibly long answer
+                if stripped:
+                    return stripped
 
         return "I apologize, but I couldn't generate a specific answer. Please try rephrasing."
 
@@ -71,44 +114,42 @@ class RAGController:
         thread_id: str = "default",
         timeout: float | None = None,
     ) -> Dict[str, Any]:
-        query = (query or "").strip()
-
         timeout = timeout if timeout is not None else Config.QUERY_TIMEOUT
 
+        # Reject oversize raw input before .strip() copies the whole buffer;
+        # the slack allows for surrounding whitespace that strip() would drop
+        if query is not None and len(query) > MAX_QUERY_CHARS + _QUERY_WS_SLACK:
+            return _query_too_long(len(query))
+
+        query = query.strip() if query else ""
+
         if not query:
             log_warning("⚠️ [Controller] Empty query received")
             return {"error": "Query cannot be empty", "success": False}
 
-        if len(query) > 2000:
-            log_warning(f"⚠️ [Controller] Query too long: {len(query)} chars")
-            return {
-                "error": "Query is too long (maximum 2000 characters)",
-                "success": False,
-            }
+        if len(query) > MAX_QUERY_CHARS:
+            return _query_too_long(len(query))
 
         log_info(
-            f"🧠 [Controller] Invoking Graph | thread_id={thread_id} | query='{query[:50]}...'"
+            "🧠 [Controller] Invoking graph",
+            thread_id=thread_id,
+            query_preview=query[:50],
         )
 
-        initial_state: AgentState = {
-            "query": query,
-            "intent": "other",
-            "plan": [],
-            "filters": {},
-            "retrieved_docs": [],
-            "tool_outputs": [],
-            "synthesized_response": "",
-            "validation_result": False,
-            "iterations": 0,
-            "final_output": "",
-        }
+        initial_state: AgentState = _INITIAL_STATE_TEMPLATE.copy()
+        initial_state["query"] = query
         config = {"configurable": {"thread_id": thread_id}}
 
         try:
-            result = await asyncio.wait_for(
-                graph_app.ainvoke(initial_state, config=config),  # type: ignore[arg-type]
-                timeout=timeout,
-            )
+            if _HAS_ASYNCIO_TIMEOUT:
+                # No wrapper Task per request (unlike wait_for)
+                async with asyncio.timeout(timeout):
+                    result = await _ainvoke(initial_state, config=config)  # type: ignore[arg-type]
+            else:  # Python 3.10
+                result = await asyncio.wait_for(
+                    _ainvoke(initial_state, config=config),  # type: ignore[arg-type]
+                    timeout=timeout,
+                )
 
             final_answer = self._pick_final_answer(result)
 
@@ -118,7 +159,7 @@ class RAGController:
             # Optionally keep validation_result exposed for UI/debug:
             validation = bool(result.get("validation_result", False))
 
-            log_info(f"✅ [Controller] Graph Success | thread_id={thread_id}")
+            log_info("✅ [Controller] Graph success", thread_id=thread_id)
 
             return {
                 "answer": final_answer,
@@ -126,13 +167,15 @@ class RAGController:
                 "synthesized_response": result.get("synthesized_response", ""),
                 "response": result.get("response", ""),
                 "validation_result": validation,
+                # Docs the answer was synthesized from (CRAG refined set first)
+                "documents": result.get("refined_docs")
+                or result.get("retrieved_docs")
+                or [],
                 "thread_id": thread_id,
                 "success": success,
             }
         except asyncio.TimeoutError:
-            log_error(
-                f"⏱️ [Controller] Timeout after {timeout}s | thread_id={thread_id}"
-            )
+            log_error("⏱️ [Controller] Timeout", timeout_s=timeout, thread_id=thread_id)
             return {
                 "error": "The analysis took too long for a live response. Please try a narrower query.",
                 "answer": "**Timeout Error:** Analysis limit reached.",
@@ -142,18 +185,25 @@ class RAGController:
         except Exception as e:
             if _is_rate_limit_error(e):
                 log_error(
-                    f"⚠️ [Controller] Rate limit / quota exceeded | thread_id={thread_id}"
+                    "⚠️ [Controller] Rate limit / quota exceeded", thread_id=thread_id
                 )
                 return {
                     "error": "The service is temporarily at capacity. Please try again in a few minutes.",
                     "answer": "**Service temporarily unavailable.** Please try again shortly.",
                     "success": False,
                 }
-            error_trace = traceback.format_exc()
-            log_error(f"❌ [Controller] Graph Failure: {str(e)}", thread_id=thread_id)
+            # Only walk the frames when the trace will actually be returned
+            error_trace = traceback.format_exc() if _DEBUG else None
+            log_error("❌ [Controller] Graph Failure: %s", e, thread_id=thread_id)
             return {
                 "error": f"Internal Engine Error: {str(e)}",
                 "answer": "### System Error\nThe Intelligence Engine encountered a failure. Our team has been notified.",
-                "traceback": error_trace if os.getenv("DEBUG") == "true" else None,
+                "traceback": error_trace,
                 "success": False,
             }
+
+
+@lru_cache(maxsize=1)
+def get_controller() -> RAGController:
+    """Process-wide RAGController, created on first use."""
+    return RAGController()
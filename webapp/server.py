@@ -4,34 +4,56 @@ Server - Tier 1 Production Web Gateway
 Corrected imports to point to webapp/retrieval/query_controller.py.
 """
 
+import asyncio
 import os
-import time
+from contextlib import asynccontextmanager
+from typing import Annotated
 
 from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app import bootstrap  # noqa: F401 - load .env before app.config
 from app.config import Config, setup_environment
-from app.dependencies import APIKeyDep, get_request_context
+from app.dependencies import APIKeyDep
 from observability.logger import log_error, log_info
 from observability.monitor import SystemMonitor
-from webapp.retrieval.query_controller import RAGController
+from observability.tracer import get_current_request_id, request_id_var, set_request_id
+from tools.treasury import aclose_client as close_treasury_client
+from webapp.orjson_response import ORJSONResponse
+from webapp.retrieval.query_controller import RAGController, get_controller
 
 setup_environment()
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+    # Release pooled downstream connections (TreasuryTool's shared httpx client)
+    await close_treasury_client()
+
+
 # 3. App Initialization
-limiter = Limiter(key_func=get_remote_address, default_limits=[Config.RATE_LIMIT])
+# In-memory counters are per worker; set REDIS_URL so the limit holds across workers
+limiter = Limiter(
+    key_func=get_remote_address,
+    default_limits=[Config.RATE_LIMIT],
+    storage_uri=Config.RATE_LIMIT_STORAGE_URI,
+)
 app = FastAPI(
     title="Financial Regulation Intelligence Terminal",
     description="Tier 1 RAG Agent for FOMC, SEC, Basel, CFTC & EDGAR",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
@@ -39,14 +61,34 @@ app.add_middleware(SlowAPIMiddleware)
 
 
 # 4. Middleware
-# Request logging middleware - runs before routes/deps, so we see all incoming requests
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    log_info(f"📨 Incoming: {request.method} {request.url.path}")
-    response = await call_next(request)
-    return response
-
-
+class LogRequestsMiddleware:
+    """
+    Request logging - runs before routes/deps, so we see all incoming requests.
+    Pure ASGI (no BaseHTTPMiddleware): no extra task or streaming shim per request.
+
+    Also binds the request ID (X-Request-ID header, else a fresh UUID) to the
+    tracer ContextVar for the whole request, so routes and logs read it with
+    get_current_request_id() instead of a per-call dependency.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header_id = next((v for k, v in scope["headers"] if k == b"x-request-id"), None)
+        token = set_request_id(header_id.decode("latin-1") if header_id else None)
+        try:
+            log_info("📨 Incoming: %s %s", scope["method"], scope["path"])
+            await self.app(scope, receive, send)
+        finally:
+            request_id_var.reset(token)
+
+
+app.add_middleware(LogRequestsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -60,8 +102,25 @@ app.add_middleware(
 STATIC_DIR = os.path.join(os.getcwd(), "webapp", "static")
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
-# 6. Global Controller
-controller = RAGController()
+# Chat UI page, loaded once: GET / serves these bytes with no file I/O or decode
+INDEX_PATH = os.path.join(STATIC_DIR, "index.html")
+_UI_MISSING_HTML = "<h1>System Error</h1><p>Terminal UI assets not found.</p>"
+try:
+    with open(INDEX_PATH, "rb") as f:
+        _INDEX_BYTES: bytes | None = f.read()
+except FileNotFoundError:
+    log_error(f"UI index.html missing at {INDEX_PATH}")
+    _INDEX_BYTES = None
+
+
+# 6. Global Controller (singleton via get_controller; override in tests with
+# app.dependency_overrides[controller_dependency])
+async def controller_dependency() -> RAGController:
+    # async so FastAPI calls it inline instead of hopping to the threadpool
+    return get_controller()
+
+
+ControllerDep = Annotated[RAGController, Depends(controller_dependency)]
 
 
 class ChatInput(BaseModel):
@@ -69,19 +128,29 @@ class ChatInput(BaseModel):
     thread_id: str = Field(default="default_session")
 
 
+def _parse_sources(raw_docs: list) -> list:
+    """Source cards for the UI: one {title, page} per retrieved doc."""
+    # Documents carry .metadata; dict results are the metadata themselves
+    metas = [
+        d if isinstance(d, dict) else getattr(d, "metadata", None) or {}
+        for d in raw_docs
+    ]
+    return [
+        {
+            "title": m.get("title") or m.get("source") or "Regulatory Document",
+            "page": m.get("page", "N/A"),
+        }
+        for m in metas
+    ]
+
+
 # 7. Routes
 @app.get("/", response_class=HTMLResponse)
 async def serve_chat_ui():
-    """Serve the terminal web interface."""
-    try:
-        index_path = os.path.join(STATIC_DIR, "index.html")
-        with open(index_path, encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError:
-        log_error(f"UI index.html missing at {index_path}")
-        return HTMLResponse(
-            "<h1>System Error</h1><p>Terminal UI assets not found.</p>", status_code=404
-        )
+    """Serve the terminal web interface (bytes read once at startup)."""
+    if _INDEX_BYTES is None:
+        return HTMLResponse(_UI_MISSING_HTML, status_code=404)
+    return HTMLResponse(content=_INDEX_BYTES)
 
 
 @app.get("/health")
@@ -89,52 +158,65 @@ async def health_check():
     return SystemMonitor.get_system_health()
 
 
-@app.post("/ask")
+@app.post(
+    "/ask",
+    # Body is parsed manually; keep it documented in the OpenAPI schema
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ChatInput.model_json_schema()}},
+        }
+    },
+)
 @limiter.limit(Config.RATE_LIMIT)
 async def ask_rag(
     request: Request,
-    data: ChatInput,
     _auth: APIKeyDep,
-    request_id: str = Depends(get_request_context),
+    controller: ControllerDep,
 ):
-    start_time = time.perf_counter()
+    request_id = get_current_request_id()  # bound by LogRequestsMiddleware
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+
+    # Single-pass parse + validate of the raw body (pydantic-core / jiter),
+    # instead of FastAPI's json.loads followed by model validation
+    try:
+        data = ChatInput.model_validate_json(await request.body())
+    except ValidationError as e:
+        errors = e.errors(include_url=False)
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in errors]
+        ) from e
 
     try:
-        log_info(f"📥 [Web] Request: {data.thread_id} | ID: {request_id}")
+        log_info("📥 [Web] Request", thread_id=data.thread_id)
 
         result = await controller.ask(data.query, thread_id=data.thread_id)
 
         if not result or result.get("success") is False:
             error_msg = result.get("error", "Unknown Graph Error")
-            log_error(f"❌ [Web] Graph failed: {error_msg}")
+            log_error("❌ [Web] Graph failed: %s", error_msg)
             raise HTTPException(status_code=500, detail=error_msg)
 
-        raw_docs = result.get("documents", [])
-        parsed_sources = []
-        for doc in raw_docs:
-            meta = getattr(doc, "metadata", doc if isinstance(doc, dict) else {})
-            parsed_sources.append(
-                {
-                    "title": meta.get("title")
-                    or meta.get("source")
-                    or "Regulatory Document",
-                    "page": meta.get("page", "N/A"),
-                }
-            )
-
-        latency = round((time.perf_counter() - start_time) * 1000, 2)
-
-        return {
-            "answer": result.get("answer") or result.get("synthesized_response"),
-            "sources": parsed_sources,
-            "thread_id": data.thread_id,
-            "latency_ms": latency,
-            "request_id": request_id,
-        }
+        parsed_sources = _parse_sources(result.get("documents") or [])
+
+        # Raw float: latency is telemetry, no need to round server-side
+        latency = (loop.time() - start_time) * 1000.0
+
+        # Returning a Response skips FastAPI's jsonable_encoder walk entirely
+        return ORJSONResponse(
+            {
+                "answer": result.get("answer") or result.get("synthesized_response"),
+                "sources": parsed_sources,
+                "thread_id": data.thread_id,
+                "latency_ms": latency,
+                "request_id": request_id,
+            }
+        )
 
     except Exception as e:
-        log_error(f"💥 [Web] Critical failure: {str(e)}")
-        return JSONResponse(
+        log_error("💥 [Web] Critical failure: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={
                 "answer": "### Internal Server Error\nCheck server logs.",
@@ -146,4 +228,14 @@ async def ask_rag(
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("webapp.server:app", host="0.0.0.0", port=8000, reload=True)
+    # C event loop + HTTP parser; DEV=1 keeps the single-process auto-reload setup
+    dev = os.getenv("DEV") == "1"
+    uvicorn.run(
+        "webapp.server:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        reload=dev,
+        workers=1 if dev else int(os.getenv("WEB_CONCURRENCY", "2")),
+    )